@@ -11,6 +11,7 @@ from enum import IntEnum
 
 # Source.Python Imports
 #   Entities
+from entities.classes import server_classes
 from entities.helpers import inthandle_from_index
 
 
@@ -27,6 +28,7 @@ from _engines._trace import GameTrace
 from _engines._trace import Surface
 from _engines._trace import SurfaceFlags
 from _engines._trace import TraceFilter
+from _engines._trace import _TraceFilterIgnore
 from _engines._trace import EntityEnumerator
 from _engines._trace import TraceType
 from _engines._trace import CONTENTS_EMPTY
@@ -91,6 +93,8 @@ from _engines._trace import MAX_COORD_RANGE
 from _engines._trace import MIN_COORD_INTEGER
 from _engines._trace import MIN_COORD_FRACTION
 from _engines._trace import MIN_COORD_FLOAT
+#   Entities
+from _entities._entity import BaseEntity
 
 
 # =============================================================================
@@ -115,12 +119,20 @@ __all__ = ('BaseTrace',
            'Surface',
            'SurfaceFlags',
            'TraceFilter',
+           'TraceFilterIgnore',
            'TraceFilterSimple',
            'TraceType',
            'engine_trace',
            )
 
 
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the offset of the collision group once it has been found
+_collision_group_offset = None
+
+
 # =============================================================================
 # >> ENUMERATORS
 # =============================================================================
@@ -222,3 +234,56 @@ class TraceFilterSimple(TraceFilter):
     def get_trace_type(self):
         """Return the trace type."""
         return self.trace_type
+
+
+class TraceFilterIgnore(_TraceFilterIgnore):
+    """A trace filter that is evaluated without calling into Python.
+
+    Unlike :class:`TraceFilterSimple`, the engine doesn't need to call a
+    Python method for each entity the trace is about to hit.
+    """
+
+    def __init__(
+            self, ignore=(), trace_type=TraceType.EVERYTHING,
+            include_classnames=(), exclude_classnames=(),
+            ignore_collision_groups=()):
+        """Initialize the filter.
+
+        :param iterable ignore: An iterable of entity indexes to ignore. The
+            trace will not hit these entities.
+        :param TraceType trace_type: The trace type that should be used.
+        :param iterable include_classnames: If given, the trace will only
+            hit entities with one of these classnames. Entities without an
+            edict (e.g. static props) are not hit either.
+        :param iterable exclude_classnames: The trace will not hit entities
+            with one of these classnames.
+        :param iterable ignore_collision_groups: The trace will not hit
+            entities in one of these collision groups.
+        """
+        ignore_collision_groups = tuple(map(int, ignore_collision_groups))
+        super().__init__(
+            tuple(ignore), trace_type, tuple(include_classnames),
+            tuple(exclude_classnames), ignore_collision_groups,
+            _get_collision_group_offset() if ignore_collision_groups else -1)
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _get_collision_group_offset():
+    """Return the offset of the collision group of entities."""
+    global _collision_group_offset
+
+    # Has the offset already been found?
+    if _collision_group_offset is not None:
+        return _collision_group_offset
+
+    # Use the world to look up the offset, since it always exists
+    for server_class in server_classes.get_entity_server_classes(
+            BaseEntity(0)):
+        entity_property = server_class.properties.get('m_CollisionGroup')
+        if entity_property is not None:
+            _collision_group_offset = entity_property.offset
+            return _collision_group_offset
+
+    raise ValueError('Property "m_CollisionGroup" not found.')
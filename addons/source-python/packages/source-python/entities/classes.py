@@ -9,6 +9,12 @@
 #   Collections
 from collections import OrderedDict
 from collections import defaultdict
+#   Inspect
+from inspect import getattr_static
+#   Marshal
+import marshal
+#   OS
+from os import replace
 #   Warnings
 from warnings import warn
 
@@ -18,8 +24,12 @@ from configobj import Section
 
 # Source.Python Imports
 #   Core
+from core import GAME_NAME
 from core import GameConfigObj
+from core import PLATFORM
+from core import SOURCE_ENGINE
 #   Entities
+from entities import BaseEntityGenerator
 from entities import ServerClassGenerator
 from entities.datamaps import _supported_input_types
 from entities.datamaps import EntityProperty
@@ -30,14 +40,21 @@ from entities.helpers import edict_from_pointer
 from entities.helpers import baseentity_from_pointer
 from entities.props import SendPropFlags
 from entities.props import SendPropType
+#   Listeners
+from listeners import on_entity_deleted_listener_manager
+from listeners import on_level_shutdown_listener_manager
+from listeners import on_tick_listener_manager
 #   Memory
 from memory import Convention
 from memory import DataType
 from memory import get_object_pointer
+from memory import make_object
 from memory.helpers import Type
 from memory.manager import CustomType
 from memory.manager import TypeManager
 #   Paths
+from paths import CACHE_PATH
+from paths import GAME_PATH
 from paths import SP_DATA_PATH
 
 
@@ -46,6 +63,18 @@ from paths import SP_DATA_PATH
 # =============================================================================
 # Get all of the necessary paths
 _managers_path = SP_DATA_PATH / 'entities'
+_layout_cache_path = CACHE_PATH / 'entities' / 'layouts.bin'
+
+# Store the possible file names of the server binary
+_server_binary_names = (
+    ('server.dll', ) if PLATFORM == 'windows' else
+    ('server.so', 'server_i486.so'))
+
+# Store the version of the layout cache format
+_layout_cache_version = 1
+
+# Store the maximum number of changed offsets the engine can track per edict
+_max_changed_offsets = 19
 
 # Store all supported types
 _supported_descriptor_types = {
@@ -89,6 +118,35 @@ _supported_keyvalue_types = {
     FieldType.VECTOR: 'vector',
 }
 
+# Store all keyvalue types that can be accessed directly at their offset
+_direct_keyvalue_types = {
+    FieldType.BOOLEAN: 'bool',
+    FieldType.FLOAT: 'float',
+    FieldType.INTEGER: 'int',
+    FieldType.SHORT: 'short',
+    FieldType.TICK: 'int',
+    FieldType.TIME: 'float',
+}
+
+# Store all keyvalues that are only stored by KeyValue() without any side
+#   effects, so they can be accessed directly at their offset
+_direct_keyvalue_names = frozenset({
+    'fademaxdist',
+    'fademindist',
+    'fadescale',
+    'friction',
+    'gravity',
+    'health',
+    'max_health',
+    'physdamagescale',
+    'rendermode',
+    'skin',
+    'spawnflags',
+    'speed',
+    'StartDisabled',
+    'waterlevel',
+})
+
 # Store all supported property types
 _supported_property_types = {
     SendPropType.FLOAT: 'float',
@@ -113,6 +171,186 @@ for _server_class in ServerClassGenerator():
 # =============================================================================
 # >> CLASSES
 # =============================================================================
+class _LayoutCache(dict):
+    """Dictionary used to persist the layouts of server classes on disk.
+
+    The cache is keyed by the hash of the server binary, so it is
+    discarded as soon as the server gets updated.
+    """
+
+    def __init__(self, path, key):
+        """Load the cached layouts from the given path."""
+        super().__init__()
+        self.path = path
+        self.key = key
+        self._changed = False
+        self.load()
+
+    def __setitem__(self, item, layout):
+        """Store the layout and mark the cache as changed."""
+        super().__setitem__(item, layout)
+        self._changed = True
+
+    def load(self):
+        """Load the layouts from the cache file if it is still valid."""
+        # Is the server binary unknown or the cache file missing?
+        if self.key is None or not self.path.isfile():
+            return
+
+        # Try to read the cache file
+        try:
+            with self.path.open('rb') as open_file:
+                key, layouts = marshal.load(open_file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+
+        # Is the cache outdated?
+        if key != self.key:
+            return
+
+        super().update(layouts)
+
+    def save(self):
+        """Write the layouts to the cache file if they have changed."""
+        # Is there nothing new to write?
+        if self.key is None or not self._changed:
+            return
+
+        # Write to a temporary file first, so a crash can't corrupt the cache
+        self.path.parent.makedirs_p()
+        temp_path = self.path + '.tmp'
+        with temp_path.open('wb') as open_file:
+            marshal.dump((self.key, dict(self)), open_file)
+
+        replace(temp_path, self.path)
+        self._changed = False
+
+
+class _NetworkStateChanges(dict):
+    """Class used to notify the engine about changed networked fields.
+
+    By default, every change is reported immediately. If batching is
+    enabled, changed offsets are collected per entity and reported once
+    from the next tick listener call.
+
+    .. note::
+
+        Batched changes are reported at the start of the next server frame,
+        so they can reach clients one tick later than unbatched changes.
+    """
+
+    def __init__(self):
+        """Store the base attributes."""
+        super().__init__()
+        self._batched = False
+
+    @property
+    def batched(self):
+        """Return whether changes are collected until the next tick.
+
+        Batched changes are reported from the tick listener, i.e. at the
+        start of the next server frame and not at the end of the current
+        one. So they reach clients one tick later than unbatched changes.
+
+        :rtype: bool
+        """
+        return self._batched
+
+    @batched.setter
+    def batched(self, value):
+        """Enable or disable batching of the changes.
+
+        Enabling it delays all changes by one tick (see :attr:`batched`).
+        """
+        value = bool(value)
+
+        # Is the mode not changing?
+        if value == self._batched:
+            return
+
+        self._batched = value
+
+        # Was batching enabled?
+        if value:
+            on_tick_listener_manager.register_listener(self.flush)
+            on_entity_deleted_listener_manager.register_listener(
+                self._on_entity_deleted)
+            return
+
+        # Report all collected changes before switching back
+        self.flush()
+        on_tick_listener_manager.unregister_listener(self.flush)
+        on_entity_deleted_listener_manager.unregister_listener(
+            self._on_entity_deleted)
+
+    def state_changed(self, pointer, offset=None):
+        """Notify that the networked field at the given offset changed.
+
+        :param Pointer pointer: The pointer of the entity.
+        :param int offset: The offset of the changed field. If None, the
+            whole entity is marked as changed.
+        """
+        # Report the change immediately?
+        if not self._batched:
+            edict = edict_from_pointer(pointer)
+            if offset is None:
+                edict.state_changed()
+            else:
+                edict.state_changed(offset)
+            return
+
+        # Get the entity's collected changes
+        address = pointer.address
+        changes = self.get(address)
+        if changes is None:
+            changes = self[address] = (pointer, set())
+
+        # Has the whole entity already been marked?
+        offsets = changes[1]
+        if offsets is None:
+            return
+
+        # Does the whole entity need to be marked?
+        if offset is None or len(offsets) >= _max_changed_offsets:
+            self[address] = (pointer, None)
+            return
+
+        offsets.add(offset)
+
+    def flush(self):
+        """Report all collected changes to the engine."""
+        for pointer, offsets in self.values():
+
+            # Is the entity not networked (anymore)?
+            edict = _get_networked_edict(pointer)
+            if edict is None:
+                continue
+
+            if offsets is None:
+                edict.state_changed()
+                continue
+
+            for offset in offsets:
+                edict.state_changed(offset)
+
+        self.clear()
+
+    def _on_entity_deleted(self, index, base_entity):
+        """Discard the changes of the deleted entity."""
+        self.pop(base_entity.pointer.address, None)
+
+# Get the _NetworkStateChanges instance
+network_state_changes = _NetworkStateChanges()
+
+
+class _PointerProperty(property):
+    """Property that only requires the entity's pointer to get/set values.
+
+    Other attributes of a server class (e.g. pointer attributes of the
+    TypeManager) require an instance of the server class.
+    """
+
+
 class _ServerClasses(TypeManager):
     """Class used to retrieve objects dynamically for a server class."""
 
@@ -120,6 +358,102 @@ class _ServerClasses(TypeManager):
         """Store the base attributes."""
         super().__init__()
         self._entity_server_classes = defaultdict(list)
+        self._entity_attributes = dict()
+
+    def get_entity_attributes(self, entity):
+        """Return the attribute resolution table for the entity's classname.
+
+        The returned dictionary maps every attribute name available on the
+        entity's server classes to a tuple of the server class defining it
+        and the property to call with the entity's pointer directly. If the
+        attribute can only be resolved on a wrapped pointer, the second
+        item of the tuple is None.
+        """
+        # Is the entity type already stored?
+        if entity.classname in self._entity_attributes:
+
+            # Return the attributes
+            return self._entity_attributes[entity.classname]
+
+        # Create a dictionary to store the entity's attributes
+        entity_attributes = dict()
+
+        # Loop through all of the entity's server classes
+        for server_class in self.get_entity_server_classes(entity):
+
+            # Loop through all of the server class' attributes
+            for attr in dir(server_class):
+
+                # Has the attribute already been found in a previous class?
+                if attr in entity_attributes:
+                    continue
+
+                # Get the raw value of the attribute
+                value = getattr_static(server_class, attr)
+
+                # Was the property created for this server class?
+                # Those only require a pointer to get/set their values.
+                if (isinstance(value, _PointerProperty) and
+                        attr in server_class.__dict__):
+                    entity_attributes[attr] = (server_class, value)
+
+                # Otherwise, the attribute needs a wrapped pointer
+                else:
+                    entity_attributes[attr] = (server_class, None)
+
+        # Store the attributes for the entity type
+        self._entity_attributes[entity.classname] = entity_attributes
+
+        # Return the attributes
+        return entity_attributes
+
+    def get_entity_attribute(self, entity, name):
+        """Return the value of a server class attribute of the entity.
+
+        :param BaseEntity entity: The entity to get the value for.
+        :param str name: The name of the attribute.
+        :raise AttributeError: Raised if the attribute was not found.
+        """
+        # Get the server class and property that define the attribute
+        try:
+            server_class, prop = self.get_entity_attributes(entity)[name]
+
+        # If the attribute is not found, raise an error
+        except KeyError:
+            raise AttributeError(
+                'Attribute "{0}" not found'.format(name)) from None
+
+        # Can the property be retrieved using the pointer directly?
+        if prop is not None:
+            return prop.fget(entity.pointer)
+
+        # Return the attribute's value
+        return getattr(make_object(server_class, entity.pointer), name)
+
+    def set_entity_attribute(self, entity, name, value):
+        """Set the value of a server class attribute of the entity.
+
+        :param BaseEntity entity: The entity to set the value for.
+        :param str name: The name of the attribute.
+        :param value: The value to set.
+        :raise AttributeError: Raised if the attribute was not found.
+        """
+        # Get the server class and property that define the attribute
+        try:
+            server_class, prop = self.get_entity_attributes(entity)[name]
+
+        # If the attribute is not found, raise an error
+        except KeyError:
+            raise AttributeError(
+                'Attribute "{0}" not found'.format(name)) from None
+
+        # Can the property be set using the pointer directly?
+        if prop is not None and prop.fset is not None:
+            prop.fset(entity.pointer, value)
+
+        # Otherwise, set the attribute's value on a wrapped pointer
+        else:
+            setattr(server_class(entity.pointer, wrap=True), name, value)
 
     def get_entity_server_classes(self, entity):
         """Retrieve the first server class."""
@@ -204,6 +538,18 @@ class _ServerClasses(TypeManager):
         # Return the server classes
         return self._entity_server_classes[entity.classname]
 
+    def warm_layout_cache(self, generator=BaseEntityGenerator):
+        """Compute the server classes of all entities and save the cache.
+
+        This can be called by a build step or after the first map has
+        loaded, so the next restart does not need to walk the SendTables
+        and DataMaps again.
+        """
+        for entity in generator():
+            self.get_entity_server_classes(entity)
+
+        _layout_cache.save()
+
     def _get_base_server_classes(self, table):
         """Yield all baseclasses within the table."""
         # Loop through all of the props in the table
@@ -261,79 +607,67 @@ class _ServerClasses(TypeManager):
         instance.outputs = dict()
         instance.properties = dict()
 
-        # Loop through all possible properties for the server class
-        for name, prop, offset in self._find_properties(
-                _server_classes.get(class_name, {})):
+        # Get the layout of the server class
+        properties, descriptors = self._get_layout(class_name, datamap)
 
-            if prop.type not in _supported_property_types:
-                continue
+        # Get the offsets of all networked fields
+        networked_offsets = {offset for name, offset, prop_type in properties}
 
-            prop_type = _supported_property_types[prop.type]
-
-            if prop.type == SendPropType.INT:
-                bit_count = prop.bits
-                if bit_count < 1:
-                    # Note: I have yet to encounter this, so I'm not
-                    #   sure under what circumstances this can occur.
-                    # That is why this simply continues.
-                    continue
-                if bit_count >= 17:
-                    prop_type = 'int'
-                elif bit_count >= 9:
-                    prop_type = '{0}short'.format(
-                        '' if prop.is_signed() else 'u')
-                elif bit_count >= 2:
-                    prop_type = '{0}char'.format(
-                        '' if prop.is_signed() else 'u')
-                else:
-                    prop_type = 'bool'
+        # Loop through all possible properties for the server class
+        for name, offset, prop_type in properties:
 
             # Add the property to the instance
             self._add_property(
                 instance, name, offset, property_contents, prop_type, True)
 
         # Loop through all possible descriptors for the server class
-        for name, desc, offset in self._find_descriptors(datamap):
+        for (name, offset, path, flags,
+                desc_type, desc_name) in descriptors:
 
             # Is the current descriptor an Output?
-            if desc.flags & TypeDescriptionFlags.OUTPUT:
+            if flags & TypeDescriptionFlags.OUTPUT:
 
                 # Store the descriptor in the outputs dictionary
-                instance.outputs[name] = desc
+                instance.outputs[name] = self._get_descriptor(datamap, path)
 
             # Is the current descriptor a FunctionTable?
-            elif desc.flags & TypeDescriptionFlags.FUNCTIONTABLE:
+            elif flags & TypeDescriptionFlags.FUNCTIONTABLE:
 
                 # Store the descriptor in the functiontables dictionary
-                instance.functiontables[name] = desc
+                instance.functiontables[name] = self._get_descriptor(
+                    datamap, path)
 
             # Is the current descriptor a KeyValue?
-            elif desc.flags & TypeDescriptionFlags.KEY:
+            elif flags & TypeDescriptionFlags.KEY:
 
                 # Add the key value to the instance
-                self._add_keyvalue(instance, name, desc, keyvalue_contents)
+                self._add_keyvalue(
+                    instance, name, self._get_descriptor(datamap, path),
+                    keyvalue_contents, offset, offset in networked_offsets)
 
                 # Is the key value also a valid property?
-                if desc.name and desc.type in _supported_descriptor_types:
+                if desc_name and desc_type in _supported_descriptor_types:
 
                     # Add the descriptor to the instance
                     self._add_property(
-                        instance, desc.name, offset, property_contents,
-                        _supported_descriptor_types[desc.type])
+                        instance, desc_name, offset, property_contents,
+                        _supported_descriptor_types[desc_type])
 
             # Is the current descriptor an Input?
-            elif desc.flags & TypeDescriptionFlags.INPUT:
+            elif flags & TypeDescriptionFlags.INPUT:
 
                 # Add the input to the instance
-                self._add_input(instance, name, desc, input_contents)
+                self._add_input(
+                    instance, name, self._get_descriptor(datamap, path),
+                    input_contents)
 
             # Is the current descriptor of a supported type?
-            elif desc.type in _supported_descriptor_types:
+            elif desc_type in _supported_descriptor_types:
 
                 # Add the descriptor to the instance
                 self._add_property(
                     instance, name, offset, property_contents,
-                    _supported_descriptor_types[desc.type])
+                    _supported_descriptor_types[desc_type])
 
         # Get a list of all properties for the current server class
         properties = list(instance.properties)
@@ -374,6 +708,72 @@ class _ServerClasses(TypeManager):
         # Return the ServerClass
         return instance
 
+    def _get_layout(self, class_name, datamap):
+        """Return the properties and descriptors of the server class.
+
+        Properties are returned as (<name>, <offset>, <type>) values and
+        descriptors as (<name>, <offset>, <path>, <flags>, <type>,
+        <field name>) values. The layout is taken from the layout cache
+        if it has been computed before.
+        """
+        # Is the layout already cached?
+        key = (class_name, not isinstance(datamap, dict))
+        if key in _layout_cache:
+            return _layout_cache[key]
+
+        # Create a list to store the properties
+        properties = list()
+
+        # Loop through all possible properties for the server class
+        for name, prop, offset in self._find_properties(
+                _server_classes.get(class_name, {})):
+
+            if prop.type not in _supported_property_types:
+                continue
+
+            prop_type = _supported_property_types[prop.type]
+
+            if prop.type == SendPropType.INT:
+                bit_count = prop.bits
+                if bit_count < 1:
+                    # Note: I have yet to encounter this, so I'm not
+                    #   sure under what circumstances this can occur.
+                    # That is why this simply continues.
+                    continue
+                if bit_count >= 17:
+                    prop_type = 'int'
+                elif bit_count >= 9:
+                    prop_type = '{0}short'.format(
+                        '' if prop.is_signed() else 'u')
+                elif bit_count >= 2:
+                    prop_type = '{0}char'.format(
+                        '' if prop.is_signed() else 'u')
+                else:
+                    prop_type = 'bool'
+
+            # Add the property to the list
+            properties.append((name, offset, prop_type))
+
+        # Get all descriptors for the server class
+        descriptors = [
+            (name, offset, path, int(desc.flags), int(desc.type), desc.name)
+            for name, desc, offset, path in self._find_descriptors(datamap)]
+
+        # Store the layout in the cache
+        layout = _layout_cache[key] = (properties, descriptors)
+
+        # Return the layout
+        return layout
+
+    @staticmethod
+    def _get_descriptor(datamap, path):
+        """Return the descriptor at the given path within the datamap."""
+        desc = datamap[path[0]]
+        for index in path[1:]:
+            desc = desc.embedded_datamap[index]
+
+        return desc
+
     def _find_properties(self, table, base_name='', base_offset=0):
         """Find send props and yield their values."""
         # Loop through all properties of the given table
@@ -406,10 +806,11 @@ class _ServerClasses(TypeManager):
                 # Yield the current property
                 yield (name, prop, offset)
 
-    def _find_descriptors(self, datamap, base_name='', base_offset=0):
+    def _find_descriptors(
+            self, datamap, base_name='', base_offset=0, base_path=()):
         """Find descriptors and yield their values."""
         # Loop through all descriptors in the datamap
-        for desc in datamap:
+        for desc_index, desc in enumerate(datamap):
 
             # Get the name of the descriptor
             name = (desc.name if desc.external_name
@@ -426,23 +827,28 @@ class _ServerClasses(TypeManager):
             # Get the updated offset of the descriptor
             offset = base_offset + desc.offset
 
+            # Get the indexes leading to the descriptor
+            path = base_path + (desc_index, )
+
             # Is the current descriptor an embedded datamap table?
             if desc.type == FieldType.EMBEDDED:
 
                 # Loop through all descriptors for the embedded datamap table
-                for new_name, new_desc, new_offset in self._find_descriptors(
-                        desc.embedded_datamap, name + '.', offset):
+                for values in self._find_descriptors(
+                        desc.embedded_datamap, name + '.', offset, path):
 
                     # Yield their values
-                    yield (new_name, new_desc, new_offset)
+                    yield values
 
             # Is the current descriptor not an embedded datamap table?
             else:
 
                 # Yield the current descriptor
-                yield (name, desc, offset)
+                yield (name, desc, offset, path)
 
-    def _add_keyvalue(self, instance, name, desc, contents):
+    def _add_keyvalue(
+            self, instance, name, desc, contents, offset=None,
+            networked=False):
         """Add the keyvalue to the instance's keyvalues dictionary."""
         # Is the KeyValue already in the keyvalues dictionary?
         if name in instance.keyvalues:
@@ -460,9 +866,17 @@ class _ServerClasses(TypeManager):
             warn('Unsupported KeyValue type "{0}".'.format(desc.type))
             return
 
+        # Can the KeyValue be accessed directly at its offset?
+        if (name in _direct_keyvalue_names and desc.size == 1 and
+                desc.type in _direct_keyvalue_types):
+            native_type = _direct_keyvalue_types[desc.type]
+        else:
+            native_type = offset = None
+
         # Add the KeyValue to the instance
         setattr(instance, contents[name], self.keyvalue(
-            name, _supported_keyvalue_types[desc.type]))
+            name, _supported_keyvalue_types[desc.type], offset, native_type,
+            networked))
 
     def _add_input(self, instance, name, desc, contents):
         """Add the input to the given instance's inputs dictionary."""
@@ -495,7 +909,8 @@ class _ServerClasses(TypeManager):
         value = self.instance_attribute(prop_type, offset)
 
         # Add the property to the properties dictionary
-        instance.properties[name] = EntityProperty(value, prop_type, networked)
+        instance.properties[name] = EntityProperty(
+            value, prop_type, networked, offset)
 
         # Is the property not a named property?
         if name not in contents:
@@ -516,8 +931,36 @@ class _ServerClasses(TypeManager):
                 prop_type, offset, networked))
 
     @staticmethod
-    def keyvalue(name, type_name):
-        """Entity keyvalue."""
+    def keyvalue(
+            name, type_name, offset=None, native_type=None, networked=False):
+        """Entity keyvalue.
+
+        If an offset and a native type are given, the keyvalue is read and
+        written directly at its offset instead of being converted from/to
+        a string by the engine. This must only be done for keyvalues that
+        are stored by KeyValue() without any side effects.
+        """
+        # Is the keyvalue stored as a plain value?
+        if offset is not None and native_type is not None:
+            getter = 'get_' + native_type
+            setter = 'set_' + native_type
+
+            def fget(pointer):
+                """Retrieve the keyvalue for the entity."""
+                return getattr(pointer, getter)(offset)
+
+            def fset(pointer, value):
+                """Set the keyvalue and notify if the field is networked."""
+                getattr(pointer, setter)(value, offset)
+
+                # Is the keyvalue networked?
+                if networked:
+
+                    # Notify the change of state
+                    network_state_changes.state_changed(pointer, offset)
+
+            return _PointerProperty(fget, fset)
+
         def fget(pointer):
             """Retrieve the keyvalue for the entity."""
             return getattr(baseentity_from_pointer(
@@ -528,23 +971,28 @@ class _ServerClasses(TypeManager):
             getattr(baseentity_from_pointer(
                 pointer), 'set_key_value_' + type_name)(name, value)
 
-        return property(fget, fset)
+        return _PointerProperty(fget, fset)
 
     @staticmethod
     def input(name, desc):
         """Input type DataMap object."""
         argument_type = desc.type
 
+        # Store the function once it was created for the first time
+        functions = []
+
         def fget(pointer):
             """Retrieve the InputFunction instance."""
-            function = desc.get_input_function(
-                Convention.THISCALL,
-                (DataType.POINTER, DataType.POINTER),
-                DataType.VOID)
+            # Was the function not created yet?
+            if not functions:
+                functions.append(desc.get_input_function(
+                    Convention.THISCALL,
+                    (DataType.POINTER, DataType.POINTER),
+                    DataType.VOID))
 
-            return InputFunction(name, argument_type, function, pointer)
+            return InputFunction(name, argument_type, functions[0], pointer)
 
-        return property(fget)
+        return _PointerProperty(fget)
 
     def entity_property(self, type_name, offset, networked):
         """Entity property."""
@@ -595,9 +1043,45 @@ class _ServerClasses(TypeManager):
             if networked:
 
                 # Notify the change of state
-                edict_from_pointer(ptr).state_changed()
+                network_state_changes.state_changed(ptr, offset)
+
+        return _PointerProperty(fget, fset)
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _get_networked_edict(pointer):
+    """Return the edict of the entity or None if it is not networked."""
+    try:
+        return edict_from_pointer(pointer)
+    except ValueError:
+        return None
+
+
+def _get_layout_cache_key():
+    """Return the key used to validate the layout cache.
+
+    If the server binary could not be found, None is returned.
+    """
+    for name in _server_binary_names:
+        path = GAME_PATH / 'bin' / name
+        if not path.isfile():
+            continue
+
+        # Use the modification time and size to detect a changed binary
+        stat = path.stat()
+        return (
+            _layout_cache_version, SOURCE_ENGINE, GAME_NAME,
+            stat.st_mtime_ns, stat.st_size)
+
+    return None
+
+# Get the _LayoutCache instance
+_layout_cache = _LayoutCache(_layout_cache_path, _get_layout_cache_key())
 
-        return property(fget, fset)
+# Save new layouts when the map changes
+on_level_shutdown_listener_manager.register_listener(_layout_cache.save)
 
 # Get the _ServerClasses instance
 server_classes = _ServerClasses()
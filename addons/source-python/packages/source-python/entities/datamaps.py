@@ -100,11 +100,12 @@ class TypeDescriptionFlags(IntEnum):
 class EntityProperty(object):
     """Class used to store property information for verification."""
 
-    def __init__(self, instance, prop_type, networked):
+    def __init__(self, instance, prop_type, networked, offset=None):
         """Store the base attributes on instantiation."""
         self._instance = instance
         self._prop_type = prop_type
         self._networked = networked
+        self._offset = offset
 
     @property
     def instance(self):
@@ -121,6 +122,11 @@ class EntityProperty(object):
         """Return whether the property is networked."""
         return self._networked
 
+    @property
+    def offset(self):
+        """Return the offset of the property within the entity."""
+        return self._offset
+
 
 class InputFunction(Function):
     """Class used to create and call an Input type function."""
@@ -18,10 +18,11 @@ from engines.trace import engine_trace
 from engines.trace import ContentMasks
 from engines.trace import GameTrace
 from engines.trace import Ray
-from engines.trace import TraceFilterSimple
+from engines.trace import TraceFilterIgnore
 #   Entities
 from entities import BaseEntityGenerator
 from entities import TakeDamageInfo
+from entities.classes import network_state_changes
 from entities.classes import server_classes
 from entities.constants import DamageTypes
 from entities.constants import RenderMode
@@ -85,23 +86,13 @@ class Entity(BaseEntity):
 
     def __getattr__(self, attr):
         """Find if the attribute is valid and returns the appropriate value."""
-        # Loop through all of the entity's server classes
-        for server_class in self.server_classes:
-
-            # Does the current server class contain the given attribute?
-            if hasattr(server_class, attr):
-
-                # Return the attribute's value
-                return getattr(make_object(server_class, self.pointer), attr)
-
-        # If the attribute is not found, raise an error
-        raise AttributeError('Attribute "{0}" not found'.format(attr))
+        # Return the value of the server class attribute
+        return server_classes.get_entity_attribute(self, attr)
 
     def __setattr__(self, attr, value):
         """Find if the attribute is value and sets its value."""
         # Is the given attribute a property?
-        if (attr in super().__dir__() and isinstance(
-                getattr(self.__class__, attr, None), property)):
+        if isinstance(getattr(self.__class__, attr, None), property):
 
             # Set the property's value
             object.__setattr__(self, attr, value)
@@ -109,17 +100,14 @@ class Entity(BaseEntity):
             # No need to go further
             return
 
-        # Loop through all of the entity's server classes
-        for server_class in self.server_classes:
-
-            # Does the current server class contain the given attribute?
-            if hasattr(server_class, attr):
+        # Does any server class contain the given attribute?
+        if attr in server_classes.get_entity_attributes(self):
 
-                # Set the attribute's value
-                setattr(server_class(self.pointer, wrap=True), attr, value)
+            # Set the value of the server class attribute
+            server_classes.set_entity_attribute(self, attr, value)
 
-                # No need to go further
-                return
+            # No need to go further
+            return
 
         # If the attribute is not found, just set the attribute
         super().__setattr__(attr, value)
@@ -518,7 +506,8 @@ class Entity(BaseEntity):
             if server_class.properties[name].networked:
 
                 # Notify the change of state
-                self.edict.state_changed()
+                network_state_changes.state_changed(
+                    self.pointer, server_class.properties[name].offset)
 
             # No need to go further
             return
@@ -534,11 +523,11 @@ class Entity(BaseEntity):
         for server_class in self.server_classes:
 
             # Does the current server class contain the input?
-            if name in server_class.inputs:
+            input_property = server_class.inputs.get(name)
+            if input_property is not None:
 
                 # Return the InputFunction instance for the given input name
-                return getattr(
-                    make_object(server_class._inputs, self.pointer), name)
+                return input_property.fget(self.pointer)
 
         # If no server class contains the input, raise an error
         raise ValueError(
@@ -576,7 +565,7 @@ class Entity(BaseEntity):
         trace = GameTrace()
 
         # Do the trace
-        engine_trace.trace_ray(ray, mask, TraceFilterSimple(
+        engine_trace.trace_ray(ray, mask, TraceFilterIgnore(
             [entity.index for entity in generator()]), trace)
 
         # Return whether or not the trace did hit
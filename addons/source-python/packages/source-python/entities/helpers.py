@@ -24,6 +24,8 @@ from _entities._helpers import edict_from_index
 from _entities._helpers import edict_from_inthandle
 from _entities._helpers import edict_from_pointer
 from _entities._helpers import find_output_name
+from _entities._helpers import get_field_buffer
+from _entities._helpers import get_handle_array
 from _entities._helpers import index_from_baseentity
 from _entities._helpers import index_from_basehandle
 from _entities._helpers import index_from_edict
@@ -40,6 +42,7 @@ from _entities._helpers import pointer_from_edict
 from _entities._helpers import pointer_from_index
 from _entities._helpers import pointer_from_inthandle
 from _entities._helpers import remove_entity
+from _entities._helpers import set_field_buffer
 from _entities._helpers import spawn_entity
 
 
@@ -63,6 +66,8 @@ __all__ = ('baseentity_from_basehandle',
            'edict_from_inthandle',
            'edict_from_pointer',
            'find_output_name',
+           'get_field_buffer',
+           'get_handle_array',
            'index_from_baseentity',
            'index_from_basehandle',
            'index_from_edict',
@@ -79,5 +84,6 @@ __all__ = ('baseentity_from_basehandle',
            'pointer_from_index',
            'pointer_from_inthandle',
            'remove_entity',
+           'set_field_buffer',
            'spawn_entity',
            )
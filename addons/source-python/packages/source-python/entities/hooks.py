@@ -5,9 +5,15 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
+# Python Imports
+#   Collections
+from collections import defaultdict
+
 # Source.Python Imports
 #   Core
 from core import AutoUnload
+#   Engines
+from engines.server import global_vars
 #   Entities
 #   Memory
 from _memory import HookType
@@ -17,8 +23,11 @@ from filters.entities import EntityIter
 from listeners import OnEntityCreated
 #   Entities
 from entities.entity import Entity
+from entities.helpers import edict_from_index
+from entities.registry import entity_registry
 #   Players
 from players.entity import Player
+from players.helpers import playerinfo_from_index
 
 
 # =============================================================================
@@ -63,7 +72,12 @@ class EntityCondition(object):
         The function returns True if the entity's
         classname equals one of the passed classnames.
         """
-        return lambda entity: entity.classname in classnames
+        def test_function(entity):
+            return entity.classname in classnames
+
+        # Store the classnames, so hooks can be looked up by them
+        test_function.entity_classnames = classnames
+        return test_function
 
     @staticmethod
     def equals_datamap_classname(*classnames):
@@ -72,7 +86,12 @@ class EntityCondition(object):
         The function returns True if the entity's
         datamap classname equals one of the passed classnames.
         """
-        return lambda entity: entity.datamap.class_name in classnames
+        def test_function(entity):
+            return entity.datamap.class_name in classnames
+
+        # Store the classnames, so hooks can be looked up by them
+        test_function.datamap_classnames = classnames
+        return test_function
 
 
 class _EntityHook(AutoUnload):
@@ -94,12 +113,19 @@ class _EntityHook(AutoUnload):
         self.hooked_function = None
         self.callback = None
 
+        # Store the values the test function can be looked up by
+        self.entity_classnames = getattr(
+            test_function, 'entity_classnames', None)
+        self.datamap_classnames = getattr(
+            test_function, 'datamap_classnames', None)
+        self.index_test = _index_conditions.get(test_function)
+
     def __call__(self, callback):
         """Store the callback and try initializing the hook."""
         self.callback = callback
 
         # Try initializing the hook...
-        for entity in EntityIter():
+        for entity in self._get_candidates():
             if self.initialize(entity):
                 # Yay! The entity was the one we were looking for
                 return self
@@ -125,13 +151,37 @@ class _EntityHook(AutoUnload):
         if not self.test_function(entity):
             return False
 
+        self.add_hook(entity)
+        return True
+
+    def add_hook(self, entity):
+        """Hook the function of the given entity without testing it."""
         if callable(self.function):
             self.hooked_function = self.function(entity)
         else:
             self.hooked_function = getattr(entity, self.function)
 
         self.hooked_function.add_hook(self.hook_type, self.callback)
-        return True
+
+    def _get_candidates(self):
+        """Yield the entities that might match the test function."""
+        # Does the test function only match specific classnames?
+        if self.entity_classnames is not None:
+            for index in entity_registry.get_indexes(self.entity_classnames):
+                yield Entity(index)
+            return
+
+        # Does the test function only match specific datamaps?
+        if self.datamap_classnames is not None:
+            for classname in entity_registry:
+                indexes = tuple(entity_registry.get_indexes(classname))
+                if indexes and _get_datamap_classname(
+                        classname, indexes[0]) in self.datamap_classnames:
+                    for index in indexes:
+                        yield Entity(index)
+            return
+
+        yield from EntityIter()
 
     def _unload_instance(self):
         """Unload the hook."""
@@ -156,29 +206,170 @@ class EntityPostHook(_EntityHook):
 
 
 class _WaitingEntityHooks(list):
-    """A dictionary to store hooks waiting for intialization."""
-
-    def initialize(self, index):
+    """A list to store hooks waiting for intialization.
+
+    Hooks using a classname or player condition are indexed by it, so
+    created entities don't need to be wrapped to test these hooks.
+    """
+
+    def __init__(self):
+        """Store the base attributes."""
+        super().__init__()
+        self._entity_classnames = defaultdict(list)
+        self._datamap_classnames = defaultdict(list)
+        self._index_hooks = list()
+        self._entity_hooks = list()
+
+    def append(self, hook):
+        """Add the hook to the list and its lookup."""
+        super().append(hook)
+        for hooks in self._get_lookups(hook):
+            hooks.append(hook)
+
+    def remove(self, hook):
+        """Remove the hook from the list and its lookup."""
+        super().remove(hook)
+        for hooks in self._get_lookups(hook):
+            hooks.remove(hook)
+
+        # Remove empty classname lookups
+        for lookup in (self._entity_classnames, self._datamap_classnames):
+            for classname in tuple(lookup):
+                if not lookup[classname]:
+                    del lookup[classname]
+
+    def initialize(self, index, base_entity=None):
         """Initialize all hooks waiting for the given entity."""
         # There is nothing to do if no hook is waiting
         if not self:
             return
 
-        entity = Entity(index)
-        for hook in tuple(self):
+        entity = None
+
+        # Are there hooks waiting for specific classnames?
+        if self._entity_classnames or self._datamap_classnames:
+            classname = edict_from_index(index).classname
+
+            for hook in tuple(self._entity_classnames.get(classname, ())):
+                if entity is None:
+                    entity = Entity(index)
+
+                hook.add_hook(entity)
+                self.remove(hook)
+
+            # Are there hooks waiting for specific datamaps?
+            if self._datamap_classnames:
+                for hook in tuple(self._datamap_classnames.get(
+                        _get_datamap_classname(classname, index, base_entity),
+                        ())):
+                    if entity is None:
+                        entity = Entity(index)
+
+                    hook.add_hook(entity)
+                    self.remove(hook)
+
+        # Test the hooks using a precomputed condition
+        for hook in tuple(self._index_hooks):
+            if not hook.index_test(index):
+                continue
+
+            if entity is None:
+                entity = Entity(index)
+
+            hook.add_hook(entity)
+            self.remove(hook)
+
+        # Are there no hooks that require an Entity object to be tested?
+        if not self._entity_hooks:
+            return
+
+        if entity is None:
+            entity = Entity(index)
+
+        for hook in tuple(self._entity_hooks):
             # Try initializing the hook
             if hook.initialize(entity):
                 # If it succeeded, remove the hook from the waiting list
                 self.remove(hook)
 
+    def _get_lookups(self, hook):
+        """Return the lists the hook is stored in."""
+        if hook.entity_classnames is not None:
+            return [self._entity_classnames[classname]
+                    for classname in set(hook.entity_classnames)]
+
+        if hook.datamap_classnames is not None:
+            return [self._datamap_classnames[classname]
+                    for classname in set(hook.datamap_classnames)]
+
+        if hook.index_test is not None:
+            return [self._index_hooks]
+
+        return [self._entity_hooks]
+
 _waiting_entity_hooks = _WaitingEntityHooks()
 
 
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+# Store the datamap classname of each entity classname
+_datamap_classnames = dict()
+
+
+def _get_datamap_classname(classname, index, base_entity=None):
+    """Return the datamap classname of the given entity type."""
+    datamap_classname = _datamap_classnames.get(classname)
+    if datamap_classname is None:
+        if base_entity is None:
+            base_entity = Entity(index)
+
+        datamap_classname = _datamap_classnames[classname] = (
+            base_entity.datamap.class_name)
+
+    return datamap_classname
+
+
+def _is_player_index(index):
+    """Return True if the index belongs to a player."""
+    return 0 < index <= global_vars.max_clients
+
+
+def _is_human_player_index(index):
+    """Return True if the index belongs to a human player."""
+    if not _is_player_index(index):
+        return False
+
+    steamid = _get_steamid(index)
+    return steamid is not None and steamid != 'BOT'
+
+
+def _is_bot_player_index(index):
+    """Return True if the index belongs to a bot."""
+    return _is_player_index(index) and _get_steamid(index) == 'BOT'
+
+
+def _get_steamid(index):
+    """Return the SteamID of the player or None if it is not available."""
+    try:
+        return playerinfo_from_index(index).steamid
+    except ValueError:
+        return None
+
+# Store the index based equivalents of the default conditions
+_index_conditions = {
+    EntityCondition.is_player: _is_player_index,
+    EntityCondition.is_not_player: lambda index: not _is_player_index(index),
+    EntityCondition.is_human_player: _is_human_player_index,
+    EntityCondition.is_bot_player: _is_bot_player_index,
+}
+
+
 # =============================================================================
 # >> LISTENERS
 # =============================================================================
 @OnEntityCreated
-def on_entity_created(index, ptr):
+def on_entity_created(index, base_entity):
     """Called when a new entity has been created."""
     if index is not None:
-        _waiting_entity_hooks.initialize(index)
+        _waiting_entity_hooks.initialize(index, base_entity)
@@ -0,0 +1,247 @@
+# ../entities/registry.py
+
+"""Provides a registry of all entities on the server by classname."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Bisect
+from bisect import bisect_left
+#   Collections
+from collections import defaultdict
+#   Contextlib
+from contextlib import suppress
+#   Heapq
+from heapq import merge
+
+# Source.Python Imports
+#   Entities
+from entities import BaseEntityGenerator
+from entities.helpers import index_from_pointer
+#   Listeners
+from listeners import on_entity_created_listener_manager
+from listeners import on_entity_deleted_listener_manager
+from listeners import on_level_shutdown_listener_manager
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ('entity_registry',
+           )
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _EntityRegistry(object):
+    """Class used to keep track of all entities by their classname.
+
+    Each classname is mapped to a dictionary of
+    ``{<address>: (<index>, <pointer>)}`` values. The index is None for
+    entities that are not networked. Entities are yielded in index order,
+    followed by the entities that are not networked.
+    """
+
+    def __init__(self):
+        """Store the base attributes."""
+        self._classnames = defaultdict(dict)
+        self._entities = dict()
+        self._sorted_classnames = None
+        self._sorted_entities = dict()
+
+    def __contains__(self, classname):
+        """Return whether an entity with the given classname exists."""
+        return classname in self._classnames
+
+    def __iter__(self):
+        """Iterate over all classnames that currently have entities."""
+        return iter(tuple(self._classnames))
+
+    def __len__(self):
+        """Return the number of entities in the registry."""
+        return len(self._entities)
+
+    def add(self, index, pointer, classname):
+        """Add the entity to the registry."""
+        address = pointer.address
+
+        # Was the entity already added with a different classname?
+        if address in self._entities:
+            self.remove(pointer)
+
+        # Is this the first entity of its type?
+        if classname not in self._classnames:
+            self._sorted_classnames = None
+
+        self._classnames[classname][address] = (index, pointer)
+        self._entities[address] = classname
+        self._sorted_entities.pop(classname, None)
+
+    def remove(self, pointer):
+        """Remove the entity from the registry."""
+        # Get the classname the entity was stored with
+        classname = self._entities.pop(pointer.address, None)
+
+        # Was the entity not stored?
+        if classname is None:
+            return
+
+        # Remove the entity from its classname
+        entities = self._classnames[classname]
+        del entities[pointer.address]
+        self._sorted_entities.pop(classname, None)
+
+        # Was this the last entity of its type?
+        if not entities:
+            del self._classnames[classname]
+            self._sorted_classnames = None
+
+    def clear(self):
+        """Remove all entities from the registry."""
+        self._classnames.clear()
+        self._entities.clear()
+        self._sorted_classnames = None
+        self._sorted_entities.clear()
+
+    def find_classnames(self, class_names, exact_match=True):
+        """Yield all stored classnames matching the given class names.
+
+        :param str/iterable class_names: The class names to match.
+        :param bool exact_match: If False, a classname matches if it
+            contains one of the given class names.
+        """
+        # Was only one class name given?
+        if isinstance(class_names, str):
+            class_names = [class_names]
+
+        # Are the class names required to match exactly?
+        if exact_match:
+            for class_name in class_names:
+                if class_name in self._classnames:
+                    yield class_name
+            return
+
+        # Loop through all stored classnames
+        for classname in tuple(self._classnames):
+
+            # Does the classname contain any of the given class names?
+            if any(class_name in classname for class_name in class_names):
+                yield classname
+
+    def find_prefixed_classnames(self, prefix):
+        """Yield all stored classnames starting with the given prefix."""
+        # Do the sorted classnames need to be rebuilt?
+        if self._sorted_classnames is None:
+            self._sorted_classnames = sorted(self._classnames)
+
+        sorted_classnames = self._sorted_classnames
+        for position in range(
+                bisect_left(sorted_classnames, prefix),
+                len(sorted_classnames)):
+            classname = sorted_classnames[position]
+            if not classname.startswith(prefix):
+                break
+
+            yield classname
+
+    def get_entities(self, class_names, exact_match=True):
+        """Yield (<index>, <pointer>) values for the matching entities.
+
+        :param str/iterable class_names: The class names to match.
+        :param bool exact_match: If False, a classname matches if it
+            contains one of the given class names.
+        """
+        # Get the sorted entities of each classname. These are tuples, so
+        # entities can be created/removed meanwhile.
+        entities = [
+            self._get_sorted_entities(classname) for classname in
+            tuple(self.find_classnames(class_names, exact_match))]
+
+        # Is there only one classname?
+        if len(entities) == 1:
+            yield from entities[0]
+            return
+
+        yield from merge(*entities, key=_get_sort_key)
+
+    def get_indexes(self, class_names, exact_match=True):
+        """Yield the indexes of the matching networked entities.
+
+        :param str/iterable class_names: The class names to match.
+        :param bool exact_match: If False, a classname matches if it
+            contains one of the given class names.
+        """
+        for index, pointer in self.get_entities(class_names, exact_match):
+            if index is not None:
+                yield index
+
+    def count(self, class_names, exact_match=True):
+        """Return the number of entities matching the given class names.
+
+        :param str/iterable class_names: The class names to match.
+        :param bool exact_match: If False, a classname matches if it
+            contains one of the given class names.
+        :rtype: int
+        """
+        return sum(
+            len(self._classnames[classname]) for classname in
+            self.find_classnames(class_names, exact_match))
+
+    def count_prefixed(self, prefix):
+        """Return the number of entities whose classname has the prefix.
+
+        :rtype: int
+        """
+        return sum(
+            len(self._classnames[classname]) for classname in
+            self.find_prefixed_classnames(prefix))
+
+    def _get_sorted_entities(self, classname):
+        """Return the (<index>, <pointer>) values of the classname sorted."""
+        entities = self._sorted_entities.get(classname)
+        if entities is None:
+            entities = self._sorted_entities[classname] = tuple(sorted(
+                self._classnames[classname].values(), key=_get_sort_key))
+
+        return entities
+
+    def _on_entity_created(self, index, base_entity):
+        """Store the created entity."""
+        self.add(index, base_entity.pointer, base_entity.classname)
+
+    def _on_entity_deleted(self, index, base_entity):
+        """Remove the deleted entity."""
+        self.remove(base_entity.pointer)
+
+    def _on_level_shutdown(self):
+        """Remove all entities of the map."""
+        self.clear()
+
+
+# Get the _EntityRegistry instance and register the listeners
+entity_registry = _EntityRegistry()
+on_entity_created_listener_manager.register_listener(
+    entity_registry._on_entity_created)
+on_entity_deleted_listener_manager.register_listener(
+    entity_registry._on_entity_deleted)
+on_level_shutdown_listener_manager.register_listener(
+    entity_registry._on_level_shutdown)
+
+# Add all entities that already exist
+for _base_entity in BaseEntityGenerator():
+    _pointer = _base_entity.pointer
+    _index = None
+    with suppress(ValueError):
+        _index = index_from_pointer(_pointer)
+    entity_registry.add(_index, _pointer, _base_entity.classname)
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _get_sort_key(entity):
+    """Return the key to sort (<index>, <pointer>) values by."""
+    index = entity[0]
+    return (1, 0) if index is None else (0, index)
@@ -0,0 +1,262 @@
+# ../entities/snapshot.py
+
+"""Provides bulk access to entity properties as columnar buffers."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Collections
+from collections import defaultdict
+#   Struct
+from struct import calcsize
+
+# Source.Python Imports
+#   Entities
+from entities.classes import network_state_changes
+from entities.classes import server_classes
+from entities.entity import BaseEntity
+from entities.helpers import edict_from_index
+from entities.helpers import get_field_buffer
+from entities.helpers import pointer_from_index
+from entities.helpers import set_field_buffer
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ('get_property_columns',
+           'set_property_columns',
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the buffer format and item count of all supported property types
+_column_formats = {
+    'bool': ('?', 1),
+    'char': ('b', 1),
+    'uchar': ('B', 1),
+    'short': ('h', 1),
+    'ushort': ('H', 1),
+    'int': ('i', 1),
+    'uint': ('I', 1),
+    'float': ('f', 1),
+    'Color': ('B', 4),
+    'Interval': ('f', 2),
+    'QAngle': ('f', 3),
+    'Quaternion': ('f', 4),
+    'Vector': ('f', 3),
+}
+
+# Store the resolved properties as {(<classname>, <name>): <values>}
+_property_layouts = dict()
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def get_property_columns(indexes, names):
+    """Read the given properties of all given entities at once.
+
+    Each property is copied by one native call into a contiguous buffer.
+    Properties with more than one value per entity (e.g. Vector) are
+    returned as two-dimensional buffers of the shape (entities, values).
+
+    Example:
+
+    .. code:: python
+
+        from entities.snapshot import get_property_columns
+        from filters.players import PlayerIter
+
+        indexes = [player.index for player in PlayerIter('alive')]
+        columns = get_property_columns(
+            indexes, ['m_iHealth', 'm_ArmorValue'])
+
+        health = columns['m_iHealth']
+
+    :param iterable indexes: The indexes of the entities.
+    :param iterable names: The names of the properties to read.
+    :return: A dictionary of ``{<name>: <memoryview>}`` values. The
+        memoryview objects support the buffer protocol, so they can be
+        passed to ``numpy.asarray`` without a copy.
+    :rtype: dict
+    :raise TypeError: Raised if a property is of an unsupported type or
+        has different types for the given entities.
+    :raise ValueError: Raised if a property was not found or an index is
+        invalid.
+    """
+    indexes = list(indexes)
+    classnames = [edict_from_index(index).classname for index in indexes]
+
+    columns = dict()
+    for name in names:
+        groups = _get_groups(indexes, classnames, name)
+
+        # Were no entities given?
+        if not groups:
+            columns[name] = memoryview(b'')
+            continue
+
+        # Do all entities share the same property layout?
+        if len(groups) == 1:
+            (offset, prop_type, networked), positions = groups.popitem()
+            size = _get_size(prop_type)
+            raw = get_field_buffer(indexes, offset, size)
+
+        # Copy each group to the positions of its entities
+        else:
+            prop_type = _get_prop_type(groups, name)
+            size = _get_size(prop_type)
+            raw = bytearray(len(indexes) * size)
+            for (offset, _, networked), positions in groups.items():
+                chunk = get_field_buffer(
+                    [indexes[position] for position in positions],
+                    offset, size)
+
+                for chunk_position, position in enumerate(positions):
+                    raw[position * size:(position + 1) * size] = chunk[
+                        chunk_position * size:(chunk_position + 1) * size]
+
+        columns[name] = _get_column(raw, prop_type, len(indexes))
+
+    return columns
+
+
+def set_property_columns(indexes, columns):
+    """Write the given properties of all given entities at once.
+
+    :param iterable indexes: The indexes of the entities.
+    :param dict columns: A dictionary of ``{<name>: <buffer>}`` values.
+        Each buffer must contain the contiguous values of all entities in
+        the property's native format. The columns returned by
+        :func:`get_property_columns` are valid buffers.
+    :raise TypeError: Raised if a property is of an unsupported type or
+        has different types for the given entities.
+    :raise ValueError: Raised if a property was not found, an index is
+        invalid or a buffer has the wrong size.
+    """
+    indexes = list(indexes)
+    classnames = [edict_from_index(index).classname for index in indexes]
+
+    for name, buffer in columns.items():
+        groups = _get_groups(indexes, classnames, name)
+
+        # Were no entities given?
+        if not groups:
+            continue
+
+        # Do all entities share the same property layout?
+        if len(groups) == 1:
+            (offset, prop_type, networked), positions = groups.popitem()
+            _set_column(
+                indexes, offset, _get_size(prop_type), buffer, networked)
+            continue
+
+        # Write each group separately
+        size = _get_size(_get_prop_type(groups, name))
+        data = memoryview(buffer).cast('B')
+        for (offset, _, networked), positions in groups.items():
+            _set_column(
+                [indexes[position] for position in positions], offset, size,
+                b''.join(data[position * size:(position + 1) * size]
+                         for position in positions), networked)
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _get_groups(indexes, classnames, name):
+    """Return the positions of the indexes grouped by property layout."""
+    groups = defaultdict(list)
+    layouts = dict()
+    for position, index in enumerate(indexes):
+        classname = classnames[position]
+        layout = layouts.get(classname)
+        if layout is None:
+            layout = layouts[classname] = _get_property_layout(
+                index, classname, name)
+
+        groups[layout].append(position)
+
+    return groups
+
+
+def _get_property_layout(index, classname, name):
+    """Return the (<offset>, <type>, <networked>) values of the property."""
+    key = (classname, name)
+    layout = _property_layouts.get(key)
+    if layout is not None:
+        return layout
+
+    # Loop through all server classes of the entity
+    for server_class in server_classes.get_entity_server_classes(
+            BaseEntity(index)):
+
+        # Is the name a member of the current server class?
+        entity_property = server_class.properties.get(name)
+        if entity_property is None:
+            continue
+
+        # Is the type not supported?
+        if entity_property.prop_type not in _column_formats:
+            raise TypeError(
+                'Property "{0}" is of unsupported type {1}.'.format(
+                    name, entity_property.prop_type))
+
+        layout = _property_layouts[key] = (
+            entity_property.offset, entity_property.prop_type,
+            entity_property.networked)
+
+        return layout
+
+    # Raise an error if the property name was not found
+    raise ValueError(
+        'Property "{0}" not found for entity type "{1}"'.format(
+            name, classname))
+
+
+def _get_prop_type(groups, name):
+    """Return the property type that is shared by all groups."""
+    prop_types = {prop_type for offset, prop_type, networked in groups}
+    if len(prop_types) != 1:
+        raise TypeError(
+            'Property "{0}" has different types ({1}) for the given '
+            'entities.'.format(
+                name, ', '.join(sorted(map(str, prop_types)))))
+
+    return prop_types.pop()
+
+
+def _get_size(prop_type):
+    """Return the size in bytes of the given property type."""
+    buffer_format, count = _column_formats[prop_type]
+    return calcsize(buffer_format) * count
+
+
+def _get_column(raw, prop_type, length):
+    """Return a memoryview of the raw values in their native format."""
+    buffer_format, count = _column_formats[prop_type]
+    column = memoryview(raw)
+
+    # Is there only one value per entity?
+    if count == 1:
+        return column.cast(buffer_format)
+
+    return column.cast(buffer_format, (length, count))
+
+
+def _set_column(indexes, offset, size, buffer, networked):
+    """Write the buffer and notify about the changes of networked fields."""
+    # Are changes reported immediately?
+    if not network_state_changes.batched:
+        set_field_buffer(indexes, offset, size, buffer, networked)
+        return
+
+    set_field_buffer(indexes, offset, size, buffer, False)
+    if networked:
+        for index in indexes:
+            network_state_changes.state_changed(
+                pointer_from_index(index), offset)
@@ -0,0 +1,321 @@
+# ../entities/spatial.py
+
+"""Provides a spatial index to find entities by their origin."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Collections
+from collections import defaultdict
+#   Math
+from math import floor
+
+# Source.Python Imports
+#   Core
+from core import AutoUnload
+#   Entities
+from entities.entity import Entity
+from entities.registry import entity_registry
+#   Listeners
+from listeners import on_entity_created_listener_manager
+from listeners import on_entity_deleted_listener_manager
+from listeners import on_tick_listener_manager
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ('SpatialIndex',
+           )
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class SpatialIndex(AutoUnload):
+    """Uniform grid over the origins of entities.
+
+    The index is refreshed from a tick listener. Entities that moved since
+    their last refresh are refreshed on every tick, while resting entities
+    are only refreshed every ``rest_interval`` ticks. The resting entities
+    are split into ``rest_interval`` buckets, so every tick only walks the
+    moving entities and a single bucket.
+
+    Example:
+
+    .. code:: python
+
+        from entities.spatial import SpatialIndex
+
+        spatial_index = SpatialIndex(cell_size=256)
+
+        def hurt_players_around(origin):
+            for index in spatial_index.entities_in_sphere(
+                    origin, 300, 'player'):
+                ...
+    """
+
+    def __init__(
+            self, class_names=None, exact_match=True,
+            cell_size=256, rest_interval=16):
+        """Initialize the index and register the listeners.
+
+        :param str/iterable class_names: The class names of the entities
+            to add to the index. If None, all networked entities are added.
+        :param bool exact_match: If False, an entity is added if its
+            classname contains one of the given class names.
+        :param float cell_size: The size of the cubic grid cells in units.
+        :param int rest_interval: The number of ticks between two
+            refreshes of an entity that did not move.
+        """
+        # Was only one class name given?
+        if isinstance(class_names, str):
+            class_names = [class_names]
+
+        self.class_names = class_names
+        self.exact_match = exact_match
+        self.cell_size = cell_size
+        self.rest_interval = max(1, rest_interval)
+
+        self._tick_count = 0
+        self._entities = dict()
+        self._classnames = dict()
+        self._origins = dict()
+        self._cells = defaultdict(set)
+        self._entity_cells = dict()
+        self._moving = set()
+        self._rest_slots = defaultdict(set)
+
+        # Fill the index with all current entities
+        self.refresh()
+
+        # Register the listeners
+        on_tick_listener_manager.register_listener(self._tick)
+        on_entity_created_listener_manager.register_listener(
+            self._on_entity_created)
+        on_entity_deleted_listener_manager.register_listener(
+            self._on_entity_deleted)
+
+    def __contains__(self, index):
+        """Return whether the entity is in the index."""
+        return index in self._origins
+
+    def __len__(self):
+        """Return the number of entities in the index."""
+        return len(self._origins)
+
+    def get_origin(self, index):
+        """Return the indexed origin of the entity as a (x, y, z) tuple."""
+        return self._origins[index]
+
+    def refresh(self):
+        """Refresh the origins of all entities."""
+        for index, classname in self._get_indexes():
+            if index not in self._entities:
+                self._add_entity(index, classname)
+
+            self._refresh_entity(index)
+
+    def entities_in_sphere(
+            self, center, radius, class_names=None, exact_match=True):
+        """Return the indexes of all entities within the given sphere.
+
+        :param Vector center: The center of the sphere.
+        :param float radius: The radius of the sphere.
+        :param str/iterable class_names: If given, only entities with one of
+            these class names are returned.
+        :param bool exact_match: If False, an entity is returned if its
+            classname contains one of the given class names.
+        :rtype: list
+        """
+        x, y, z = center.x, center.y, center.z
+        squared_radius = radius * radius
+        result = list()
+        for index in self._find_candidates(
+                (x - radius, y - radius, z - radius),
+                (x + radius, y + radius, z + radius),
+                class_names, exact_match):
+            origin_x, origin_y, origin_z = self._origins[index]
+            if ((origin_x - x) ** 2 + (origin_y - y) ** 2 +
+                    (origin_z - z) ** 2 <= squared_radius):
+                result.append(index)
+
+        return result
+
+    def entities_in_box(self, mins, maxs, class_names=None, exact_match=True):
+        """Return the indexes of all entities within the given box.
+
+        :param Vector mins: The minimum corner of the box.
+        :param Vector maxs: The maximum corner of the box.
+        :param str/iterable class_names: If given, only entities with one of
+            these class names are returned.
+        :param bool exact_match: If False, an entity is returned if its
+            classname contains one of the given class names.
+        :rtype: list
+        """
+        mins = (mins.x, mins.y, mins.z)
+        maxs = (maxs.x, maxs.y, maxs.z)
+        result = list()
+        for index in self._find_candidates(
+                mins, maxs, class_names, exact_match):
+            origin = self._origins[index]
+            if all(low <= value <= high for low, value, high in zip(
+                    mins, origin, maxs)):
+                result.append(index)
+
+        return result
+
+    def _find_candidates(self, mins, maxs, class_names, exact_match):
+        """Yield all indexes within the cells overlapping the given box."""
+        # Was only one class name given?
+        if isinstance(class_names, str):
+            class_names = [class_names]
+
+        min_cell = self._get_cell(mins)
+        max_cell = self._get_cell(maxs)
+
+        # Does the box overlap more cells than there are entities?
+        cell_count = 1
+        for low, high in zip(min_cell, max_cell):
+            cell_count *= high - low + 1
+
+        if cell_count > len(self._entity_cells):
+            indexes = tuple(self._origins)
+        else:
+            indexes = list()
+            for cell_x in range(min_cell[0], max_cell[0] + 1):
+                for cell_y in range(min_cell[1], max_cell[1] + 1):
+                    for cell_z in range(min_cell[2], max_cell[2] + 1):
+                        cell = self._cells.get((cell_x, cell_y, cell_z))
+                        if cell:
+                            indexes.extend(cell)
+
+        # Are there no class names to filter?
+        if not class_names:
+            yield from indexes
+            return
+
+        for index in indexes:
+            if _matches(self._classnames[index], class_names, exact_match):
+                yield index
+
+    def _get_cell(self, origin):
+        """Return the cell of the given (x, y, z) origin."""
+        cell_size = self.cell_size
+        return tuple(floor(value / cell_size) for value in origin)
+
+    def _get_indexes(self):
+        """Yield (<index>, <classname>) values of entities to index."""
+        classnames = entity_registry if self.class_names is None else (
+            entity_registry.find_classnames(
+                self.class_names, self.exact_match))
+
+        for classname in tuple(classnames):
+            for index in entity_registry.get_indexes(classname):
+                yield index, classname
+
+    def _add_entity(self, index, classname):
+        """Start tracking the entity.
+
+        The entity is marked as moving, so it is refreshed on the next tick.
+        """
+        self._entities[index] = Entity(index)
+        self._classnames[index] = classname
+        self._rest_slots[index % self.rest_interval].add(index)
+        self._moving.add(index)
+
+    def _refresh_entity(self, index):
+        """Refresh the origin of the entity and move it to its cell."""
+        try:
+            origin = self._entities[index].origin
+        except (AttributeError, ValueError):
+            self._moving.discard(index)
+            return
+
+        origin = (origin.x, origin.y, origin.z)
+
+        # Did the entity not move?
+        if self._origins.get(index) == origin:
+            self._moving.discard(index)
+            return
+
+        self._origins[index] = origin
+        self._moving.add(index)
+
+        # Did the entity stay within its cell?
+        cell = self._get_cell(origin)
+        old_cell = self._entity_cells.get(index)
+        if old_cell == cell:
+            return
+
+        if old_cell is not None:
+            self._remove_from_cell(index, old_cell)
+
+        self._cells[cell].add(index)
+        self._entity_cells[index] = cell
+
+    def _remove_from_cell(self, index, cell):
+        """Remove the entity from the given cell."""
+        indexes = self._cells[cell]
+        indexes.discard(index)
+        if not indexes:
+            del self._cells[cell]
+
+    def _remove_entity(self, index):
+        """Remove the entity from the index."""
+        if self._entities.pop(index, None) is None:
+            return
+
+        self._classnames.pop(index, None)
+        self._origins.pop(index, None)
+        self._moving.discard(index)
+        rest_slot = index % self.rest_interval
+        self._rest_slots[rest_slot].discard(index)
+        if not self._rest_slots[rest_slot]:
+            del self._rest_slots[rest_slot]
+
+        cell = self._entity_cells.pop(index, None)
+        if cell is not None:
+            self._remove_from_cell(index, cell)
+
+    def _tick(self):
+        """Refresh moving entities and a share of the resting entities."""
+        self._tick_count += 1
+        rest_slot = self._tick_count % self.rest_interval
+        for index in self._moving | self._rest_slots.get(rest_slot, set()):
+            self._refresh_entity(index)
+
+    def _on_entity_created(self, index, base_entity):
+        """Add the created entity to the index if its classname matches."""
+        if index is None or index in self._entities:
+            return
+
+        classname = base_entity.classname
+        if self.class_names is None or _matches(
+                classname, self.class_names, self.exact_match):
+            self._add_entity(index, classname)
+
+    def _on_entity_deleted(self, index, base_entity):
+        """Remove the deleted entity from the index."""
+        if index is not None:
+            self._remove_entity(index)
+
+    def _unload_instance(self):
+        """Unregister the listeners."""
+        on_tick_listener_manager.unregister_listener(self._tick)
+        on_entity_created_listener_manager.unregister_listener(
+            self._on_entity_created)
+        on_entity_deleted_listener_manager.unregister_listener(
+            self._on_entity_deleted)
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _matches(classname, class_names, exact_match):
+    """Return whether the classname matches one of the class names."""
+    if exact_match:
+        return classname in class_names
+
+    return any(class_name in classname for class_name in class_names)
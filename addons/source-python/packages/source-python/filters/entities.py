@@ -9,10 +9,17 @@
 #   Entities
 from entities import BaseEntityGenerator
 from entities import EntityGenerator
+from entities.entity import BaseEntity
 from entities.entity import Entity
 from entities.helpers import index_from_edict
+from entities.registry import entity_registry
 #   Filters
 from filters.iterator import _IterObject
+#   Listeners
+from listeners import on_entity_created_listener_manager
+from listeners import on_entity_deleted_listener_manager
+#   Memory
+from memory import make_object
 
 
 # =============================================================================
@@ -29,6 +36,12 @@ __all__ = ('BaseEntityIter',
 class BaseEntityIter(_IterObject):
     """BaseEntity iterate class."""
 
+    # Store the listener managers invalidating the snapshots
+    _snapshot_listeners = (
+        on_entity_created_listener_manager,
+        on_entity_deleted_listener_manager,
+    )
+
     def __init__(self, class_names=None, exact_match=True):
         """Store the base attributes for the generator."""
         # Was only one class name given?
@@ -41,11 +54,46 @@ class BaseEntityIter(_IterObject):
         self.class_names = list() if class_names is None else class_names
         self.exact_match = exact_match
 
+    def _iter_items(self):
+        """Iterate through the entities matching the class names."""
+        # Are there no class names to look up in the entity registry?
+        if not self.class_names:
+            yield from super()._iter_items()
+            return
+
+        # Loop through all entities matching the class names
+        for index, pointer in entity_registry.get_entities(
+                self.class_names, self.exact_match):
+
+            # Get the object for the current entity
+            entity = self._get_entity(index, pointer)
+
+            # Is the entity yieldable?
+            if entity is not None:
+                yield entity
+
+    def __len__(self):
+        """Return the length of the generator at this current time."""
+        # Are there no class names to look up in the entity registry?
+        if not self.class_names:
+            return super().__len__()
+
+        return entity_registry.count(self.class_names, self.exact_match)
+
     @staticmethod
     def iterator():
         """Iterate over all :class:`entities.entity.BaseEntity` objects."""
         return BaseEntityGenerator()
 
+    def _get_snapshot_key(self):
+        """Return the key to store the snapshot of the instance with."""
+        return tuple(self.class_names), self.exact_match
+
+    @staticmethod
+    def _get_entity(index, pointer):
+        """Return the object to yield for a registered entity."""
+        return make_object(BaseEntity, pointer)
+
     def _is_valid(self, entity):
         """Verify that the edict needs yielded."""
         # Are there any class names to be checked?
@@ -77,3 +125,22 @@ class EntityIter(BaseEntityIter):
         """Iterate over all :class:`entities.entity.Entity` objects."""
         for edict in EntityGenerator():
             yield Entity(index_from_edict(edict))
+
+    def __len__(self):
+        """Return the length of the generator at this current time."""
+        # Are there no class names to look up in the entity registry?
+        if not self.class_names:
+            return super().__len__()
+
+        # Only networked entities are yielded
+        return sum(1 for index in entity_registry.get_indexes(
+            self.class_names, self.exact_match))
+
+    @staticmethod
+    def _get_entity(index, pointer):
+        """Return the object to yield for a registered entity."""
+        # Is the entity not networked?
+        if index is None:
+            return None
+
+        return Entity(index)
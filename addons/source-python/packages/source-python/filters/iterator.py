@@ -2,6 +2,15 @@
 
 """Contains base iteration functionality for the filter package."""
 
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Source.Python Imports
+#   Engines
+from engines.server import global_vars
+#   Events
+from events.manager import event_manager
+
 
 # =============================================================================
 # >> CLASSES
@@ -17,6 +26,13 @@ class _IterObjectMeta(type):
         # Create the _filters dictionary
         cls._filters = dict()
 
+        # Create the _snapshots dictionary
+        cls._snapshots = dict()
+        cls._snapshot_tick = None
+        cls._snapshot_callback = None
+        cls._snapshot_skip_tick = None
+        cls._snapshot_skip_callback = None
+
         # Create the filters property
         cls.__class__.filters = property(
             lambda cls: cls._filters,
@@ -27,7 +43,20 @@ class _IterObjectMeta(type):
 
 
 class _IterObject(metaclass=_IterObjectMeta):
-    """Base iterator class used to yield filtered items."""
+    """Base iterator class used to yield filtered items.
+
+    If snapshots are enabled for a class, the items of each filter
+    combination are stored for the rest of the tick, so iterating with the
+    same filters again in the same tick doesn't scan the server again.
+    """
+
+    # Store the listener managers and events invalidating the snapshots
+    _snapshot_listeners = ()
+    _snapshot_events = ()
+
+    # Store the events that are fired before the state changes. No
+    #   snapshots are stored for the rest of the tick they are fired in.
+    _snapshot_pre_events = ()
 
     def __init__(self, is_filters=None, not_filters=None):
         """Store filters for the instance."""
@@ -48,6 +77,27 @@ class _IterObject(metaclass=_IterObjectMeta):
         self.not_filters = list() if not_filters is None else not_filters
 
     def __iter__(self):
+        """Iterate through the objects and filter out any unneeded items."""
+        # Are snapshots disabled for the class?
+        if self._snapshot_callback is None:
+            return self._iter_items()
+
+        return iter(self._get_snapshot())
+
+    def __len__(self):
+        """Return the length of the generator at this current time."""
+        # Are snapshots enabled for the class?
+        if self._snapshot_callback is not None:
+            return len(self._get_snapshot())
+
+        return sum(1 for item in self)
+
+    @property
+    def iterator(self):
+        """Raise an error if the inheriting class does not have their own."""
+        raise NotImplementedError('No iterator attribute defined for class.')
+
+    def _iter_items(self):
         """Iterate through the objects and filter out any unneeded items."""
         # Loop through the items in classes iterator
         for item in self.iterator():
@@ -58,14 +108,90 @@ class _IterObject(metaclass=_IterObjectMeta):
                 # Yield the current item
                 yield item
 
-    def __len__(self):
-        """Return the length of the generator at this current time."""
-        return len([x for x in self])
+    def _get_snapshot_key(self):
+        """Return the key to store the snapshot of the instance with."""
+        return tuple(self.is_filters), tuple(self.not_filters)
 
-    @property
-    def iterator(self):
-        """Raise an error if the inheriting class does not have their own."""
-        raise NotImplementedError('No iterator attribute defined for class.')
+    def _get_snapshot(self):
+        """Return the items of the current tick for the instance."""
+        cls = type(self)
+        snapshots = cls._snapshots
+
+        # Are the snapshots of an earlier tick?
+        tick = global_vars.tick_count
+        if cls._snapshot_tick != tick:
+            snapshots.clear()
+            cls._snapshot_tick = tick
+
+        # Is the state still changing during this tick?
+        if cls._snapshot_skip_tick == tick:
+            return tuple(self._iter_items())
+
+        key = self._get_snapshot_key()
+        snapshot = snapshots.get(key)
+        if snapshot is None:
+            snapshot = snapshots[key] = tuple(self._iter_items())
+
+        return snapshot
+
+    @classmethod
+    def enable_snapshots(cls):
+        """Store the items of each filter combination for the current tick.
+
+        The snapshots are discarded on the next tick or as soon as one of
+        the class' invalidating listeners or events is fired. If an event
+        is fired before the state changes (e.g. ``player_team``), no
+        snapshots are stored for the rest of the tick.
+        """
+        # Are the snapshots already enabled?
+        if cls._snapshot_callback is not None:
+            return
+
+        cls._snapshot_callback = lambda *args: cls.invalidate_snapshots()
+        for listener_manager in cls._snapshot_listeners:
+            listener_manager.register_listener(cls._snapshot_callback)
+
+        for event_name in cls._snapshot_events:
+            event_manager.register_for_event(
+                event_name, cls._snapshot_callback)
+
+        cls._snapshot_skip_callback = lambda *args: cls._skip_snapshots()
+        for event_name in cls._snapshot_pre_events:
+            event_manager.register_for_event(
+                event_name, cls._snapshot_skip_callback)
+
+    @classmethod
+    def disable_snapshots(cls):
+        """Stop storing the items of each filter combination."""
+        # Are the snapshots already disabled?
+        if cls._snapshot_callback is None:
+            return
+
+        for listener_manager in cls._snapshot_listeners:
+            listener_manager.unregister_listener(cls._snapshot_callback)
+
+        for event_name in cls._snapshot_events:
+            event_manager.unregister_for_event(
+                event_name, cls._snapshot_callback)
+
+        for event_name in cls._snapshot_pre_events:
+            event_manager.unregister_for_event(
+                event_name, cls._snapshot_skip_callback)
+
+        cls._snapshot_callback = None
+        cls._snapshot_skip_callback = None
+        cls.invalidate_snapshots()
+
+    @classmethod
+    def invalidate_snapshots(cls):
+        """Discard all snapshots of the class."""
+        cls._snapshots.clear()
+
+    @classmethod
+    def _skip_snapshots(cls):
+        """Discard all snapshots and store none for the rest of the tick."""
+        cls._snapshots.clear()
+        cls._snapshot_skip_tick = global_vars.tick_count
 
     def _is_valid(self, item):
         """Return whether the given item is valid for the instances filters."""
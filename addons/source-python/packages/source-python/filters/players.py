@@ -13,9 +13,13 @@ from configobj import ConfigObj
 #   Core
 from core import GAME_NAME
 #   Entities
+from entities.classes import server_classes
 from entities.helpers import index_from_edict
 #   Filters
 from filters.iterator import _IterObject
+#   Listeners
+from listeners import on_client_disconnect_listener_manager
+from listeners import on_client_put_in_server_listener_manager
 #   Paths
 from paths import SP_DATA_PATH
 #   Players
@@ -36,12 +40,69 @@ __all__ = ('PlayerIter',
 # Get the team's file for the current game
 _game_teams = ConfigObj(SP_DATA_PATH / 'teams' / GAME_NAME + '.ini')
 
+# Store the flags PlayerGenerator uses for the built-in filters
+_filter_flags = {
+    'bot': 1 << 0,
+    'human': 1 << 1,
+    'alive': 1 << 2,
+    'dead': 1 << 3,
+}
+
+# Store the built-in filters as {<name>: (<function>, <flags>, <team>)}
+_native_filters = dict()
+
+# Store the offset of the dead flag once it has been found
+_dead_flag_offset = None
+
 
 # =============================================================================
 # >> PLAYER ITERATION CLASSES
 # =============================================================================
 class PlayerIter(_IterObject):
-    """Player iterate class."""
+    """Player iterate class.
+
+    The built-in filters (``all``, ``bot``, ``human``, ``alive``, ``dead``
+    and the team names) are evaluated by :class:`players.PlayerGenerator`,
+    so :class:`players.entity.Player` objects are only created for the
+    players passing them.
+    """
+
+    # Store the listener managers and events invalidating the snapshots
+    _snapshot_listeners = (
+        on_client_put_in_server_listener_manager,
+        on_client_disconnect_listener_manager,
+    )
+    _snapshot_events = ('player_spawn', 'player_death')
+    _snapshot_pre_events = ('player_team', )
+
+    def _iter_items(self):
+        """Iterate over all players passing the filters."""
+        is_filters, not_filters, generator = self._get_generator()
+        for edict in generator:
+            player = Player(index_from_edict(edict))
+            if self._passes(player, is_filters, not_filters):
+                yield player
+
+    def __len__(self):
+        """Return the number of players passing the filters."""
+        # Are snapshots enabled for the class?
+        if self._snapshot_callback is not None:
+            return super().__len__()
+
+        return sum(1 for index in self.indexes())
+
+    def indexes(self):
+        """Iterate over the indexes of all players passing the filters."""
+        is_filters, not_filters, generator = self._get_generator()
+        for edict in generator:
+            index = index_from_edict(edict)
+
+            # Are all filters evaluated natively?
+            if not is_filters and not not_filters:
+                yield index
+
+            elif self._passes(Player(index), is_filters, not_filters):
+                yield index
 
     @staticmethod
     def iterator():
@@ -52,6 +113,93 @@ class PlayerIter(_IterObject):
             # Yield the Player instance for the current edict
             yield Player(index_from_edict(edict))
 
+    def _get_generator(self):
+        """Return the remaining filters and a filtering PlayerGenerator."""
+        flags = [0, 0]
+        teams = [0, 0]
+        remaining = ([], [])
+        for position, filter_names in enumerate(
+                (self.is_filters, self.not_filters)):
+            for filter_name in filter_names:
+                native = _native_filters.get(filter_name)
+
+                # Was the built-in filter replaced or does it not exist?
+                if (native is None or
+                        self._filters.get(filter_name) is not native[0]):
+                    remaining[position].append(filter_name)
+                    continue
+
+                function, filter_flags, team = native
+
+                # Is this the "all" filter?
+                if not filter_flags and team is None:
+                    if position:
+                        remaining[position].append(filter_name)
+                    continue
+
+                flags[position] |= filter_flags
+                if team is not None:
+                    teams[position] |= 1 << team
+
+        dead_flag_offset = -1
+        if (flags[0] | flags[1]) & (_filter_flags['alive'] |
+                                    _filter_flags['dead']):
+            dead_flag_offset = _get_dead_flag_offset()
+
+        return remaining + (PlayerGenerator(
+            flags[0], flags[1], teams[0], teams[1], dead_flag_offset), )
+
+    def _passes(self, player, is_filters, not_filters):
+        """Return whether the player passes the given filters."""
+        for filter_name in is_filters:
+            if not self._filters[filter_name](player):
+                return False
+
+        for filter_name in not_filters:
+            if self._filters[filter_name](player):
+                return False
+
+        return True
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _register_native_filter(filter_name, function, flags=0, team=None):
+    """Register a built-in filter that PlayerGenerator can evaluate."""
+    PlayerIter.register_filter(filter_name, function)
+
+    # Can the team not be passed as a bit of the team mask?
+    if team is not None and not 0 <= team < 32:
+        return
+
+    _native_filters[filter_name] = (function, flags, team)
+
+
+def _get_dead_flag_offset():
+    """Return the offset of the dead flag of players or -1 if unknown."""
+    global _dead_flag_offset
+
+    # Has the offset already been found?
+    if _dead_flag_offset is not None:
+        return _dead_flag_offset
+
+    # Get the first player to look up the offset
+    for edict in PlayerGenerator():
+        break
+    else:
+        return -1
+
+    _dead_flag_offset = -1
+    for server_class in server_classes.get_entity_server_classes(
+            Player(index_from_edict(edict))):
+        entity_property = server_class.properties.get('pl.deadflag')
+        if entity_property is not None and entity_property.offset is not None:
+            _dead_flag_offset = entity_property.offset
+            break
+
+    return _dead_flag_offset
+
 
 # =============================================================================
 # PLAYER TEAM CLASSES
@@ -87,11 +235,16 @@ class _Team(object):
 # >> FILTER REGISTRATION
 # =============================================================================
 # Register the filter functions
-PlayerIter.register_filter('all', lambda player: True)
-PlayerIter.register_filter('bot', lambda player: player.is_fake_client())
-PlayerIter.register_filter('human', lambda player: not player.is_fake_client())
-PlayerIter.register_filter('alive', lambda player: not player.dead)
-PlayerIter.register_filter('dead', lambda player: player.dead)
+_register_native_filter('all', lambda player: True)
+_register_native_filter(
+    'bot', lambda player: player.is_fake_client(), _filter_flags['bot'])
+_register_native_filter(
+    'human', lambda player: not player.is_fake_client(),
+    _filter_flags['human'])
+_register_native_filter(
+    'alive', lambda player: not player.dead, _filter_flags['alive'])
+_register_native_filter(
+    'dead', lambda player: player.dead, _filter_flags['dead'])
 
 # Loop through all teams in the game's team file
 for _team in _game_teams.get('names', {}):
@@ -100,8 +253,9 @@ for _team in _game_teams.get('names', {}):
     _player_teams[_team] = int(_game_teams['names'][_team])
 
     # Register the filter
-    PlayerIter.register_filter(
-        _team, _player_teams[_team]._player_is_on_team)
+    _register_native_filter(
+        _team, _player_teams[_team]._player_is_on_team,
+        team=_player_teams[_team].team)
 
 # Loop through all base team names
 for _number, _team in enumerate(('un', 'spec', 't', 'ct')):
@@ -116,5 +270,6 @@ for _number, _team in enumerate(('un', 'spec', 't', 'ct')):
     _player_teams[_team] = _number
 
     # Register the filter
-    PlayerIter.register_filter(
-        _team, _player_teams[_team]._player_is_on_team)
+    _register_native_filter(
+        _team, _player_teams[_team]._player_is_on_team,
+        team=_player_teams[_team].team)
@@ -6,8 +6,16 @@
 # >> IMPORTS
 # ============================================================================
 # Source.Python Imports
+#   Engines
+from engines.server import global_vars
+#   Events
+from events.manager import event_manager
 #   Filters
 from _filters._recipients import _RecipientFilter
+from filters.players import PlayerIter
+#   Listeners
+from listeners import on_client_disconnect_listener_manager
+from listeners import on_client_put_in_server_listener_manager
 #   Players
 from players.entity import Player
 
@@ -19,6 +27,13 @@ __all__ = ('RecipientFilter',
            )
 
 
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the highest index that can be represented by a bit mask
+_max_bit_index = 64
+
+
 # ============================================================================
 # >> CLASSES
 # ============================================================================
@@ -50,18 +65,111 @@ class RecipientFilter(_RecipientFilter):
 
     def __iter__(self):
         """Iterate over the recipient filter."""
-        # Loop through each index in the filter
-        for index in range(len(self)):
+        bits = self.get_bits()
 
-            # Yield the recipient
-            yield self.get_recipient_index(index)
+        # Are there indexes that can't be represented by the bit mask?
+        if _count_bits(bits) != len(self):
+
+            # Loop through each index in the filter
+            return map(self.get_recipient_index, range(len(self)))
+
+        return _iter_bits(bits)
 
     def __repr__(self):
         """Return a readable representation of the recipient filter."""
         return '({0})'.format(', '.join(map(str, self)))
 
+    def __or__(self, other):
+        """Return a new recipient filter with the recipients of both."""
+        bits, indexes = _get_bits(self)
+        other_bits, other_indexes = _get_bits(other)
+        return self.from_bits(bits | other_bits, indexes | other_indexes)
+
+    def __and__(self, other):
+        """Return a new recipient filter with the common recipients."""
+        bits, indexes = _get_bits(self)
+        other_bits, other_indexes = _get_bits(other)
+        return self.from_bits(bits & other_bits, indexes & other_indexes)
+
+    def __sub__(self, other):
+        """Return a new recipient filter without the other recipients."""
+        bits, indexes = _get_bits(self)
+        other_bits, other_indexes = _get_bits(other)
+        return self.from_bits(bits & ~other_bits, indexes - other_indexes)
+
+    def __ior__(self, other):
+        """Add the other recipients to the recipient filter."""
+        bits, indexes = _get_bits(other)
+        self.add_bits(bits)
+        for index in sorted(indexes):
+            self.add_recipient(index)
+
+        return self
+
+    def __iand__(self, other):
+        """Remove all recipients that are not in the other recipients."""
+        bits, indexes = _get_bits(self)
+        other_bits, other_indexes = _get_bits(other)
+        self.remove_bits(bits & ~other_bits)
+        for index in indexes - other_indexes:
+            self.remove_recipient(index)
+
+        return self
+
+    def __isub__(self, other):
+        """Remove the other recipients from the recipient filter."""
+        bits, indexes = _get_bits(other)
+        self.remove_bits(bits)
+        for index in indexes:
+            self.remove_recipient(index)
+
+        return self
+
+    @classmethod
+    def from_bits(cls, bits, indexes=()):
+        """Return a new recipient filter for the players of the bit mask.
+
+        :param int bits: The bit mask of the players. Bit 0 represents the
+            player at index 1.
+        :param iterable indexes: Additional player indexes that can't be
+            represented by the bit mask.
+        :rtype: RecipientFilter
+        """
+        recipients = cls(())
+        recipients.set_bits(bits)
+        for index in sorted(indexes):
+            recipients.add_recipient(index)
+
+        recipients.filters = (tuple(recipients), )
+        return recipients
+
+    @classmethod
+    def from_player_filters(cls, is_filters=None, not_filters=None):
+        """Return a new recipient filter for the matching players.
+
+        The matching players are cached per filter combination for the
+        current tick or until a player connects, disconnects, spawns, dies
+        or changes the team.
+
+        :param str/iterable is_filters: The :class:`filters.players.PlayerIter`
+            filters the players need to pass.
+        :param str/iterable not_filters: The
+            :class:`filters.players.PlayerIter` filters the players must
+            not pass.
+        :rtype: RecipientFilter
+        """
+        return cls.from_bits(*_player_filter_bits.get_bits(
+            is_filters, not_filters))
+
     def merge(self, iterable):
         """Merge the given recipient."""
+        # Get the indexes without creating Player objects if possible
+        if isinstance(iterable, PlayerIter):
+            iterable = iterable.indexes()
+
+        # Collect the indexes, so they can be added with a single call
+        bits = 0
+
         # Loop through all indexes of the given recipient
         for index in iterable:
 
@@ -71,8 +179,15 @@ class RecipientFilter(_RecipientFilter):
             if isinstance(index, Player):
                 index = index.index
 
-            # Add the current index to the recipient filter
-            self.add_recipient(index)
+            # Can the index be added to the bit mask?
+            if 0 < index <= _max_bit_index:
+                bits |= 1 << (index - 1)
+            else:
+                self.add_recipient(index)
+
+        # Add the collected indexes to the recipient filter
+        if bits:
+            self.add_bits(bits)
 
     def update(self, *args, clear=True):
         """Update the recipient filter matching the given filters."""
@@ -112,3 +227,128 @@ class RecipientFilter(_RecipientFilter):
                     # Assume it is an iterable and merge it to the recipient
                     #   filter
                     self.merge(filter_)
+
+
+class _PlayerFilterBits(dict):
+    """Class used to cache the bit masks of PlayerIter filter combinations."""
+
+    def __init__(self):
+        """Store the base attributes."""
+        super().__init__()
+        self._tick = None
+        self._skip_tick = None
+
+    def get_bits(self, is_filters=None, not_filters=None):
+        """Return the bit mask of the players matching the filters.
+
+        :return: The bit mask and a frozenset of the matching indexes that
+            can't be represented by the bit mask.
+        :rtype: tuple
+        """
+        # Are the cached bit masks from a previous tick?
+        tick = global_vars.tick_count
+        if self._tick != tick:
+            self.clear()
+            self._tick = tick
+
+        # Were the filters given as strings?
+        if isinstance(is_filters, str):
+            is_filters = [is_filters]
+
+        if isinstance(not_filters, str):
+            not_filters = [not_filters]
+
+        key = (
+            () if is_filters is None else tuple(is_filters),
+            () if not_filters is None else tuple(not_filters))
+
+        # Are the players still changing during this tick?
+        if self._skip_tick == tick:
+            return _get_bits(PlayerIter(*key).indexes())
+
+        bits = self.get(key)
+        if bits is None:
+            bits = self[key] = _get_bits(PlayerIter(*key).indexes())
+
+        return bits
+
+    def _invalidate(self, *args):
+        """Discard all cached bit masks."""
+        self.clear()
+
+    def _skip(self, *args):
+        """Discard all cached bit masks and cache none during this tick.
+
+        This is used for events that are fired before the players change
+        (e.g. player_team).
+        """
+        self.clear()
+        self._skip_tick = global_vars.tick_count
+
+# Get the _PlayerFilterBits instance and register the invalidating callbacks
+_player_filter_bits = _PlayerFilterBits()
+on_client_put_in_server_listener_manager.register_listener(
+    _player_filter_bits._invalidate)
+on_client_disconnect_listener_manager.register_listener(
+    _player_filter_bits._invalidate)
+for _event_name in ('player_spawn', 'player_death'):
+    event_manager.register_for_event(
+        _event_name, _player_filter_bits._invalidate)
+event_manager.register_for_event('player_team', _player_filter_bits._skip)
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _get_bits(recipients):
+    """Return the bit mask of the given recipients.
+
+    :return: The bit mask and a frozenset of the indexes that can't be
+        represented by the bit mask.
+    :rtype: tuple
+    """
+    # Is the bit mask already available?
+    if isinstance(recipients, _RecipientFilter):
+        bits = recipients.get_bits()
+
+        # Can all indexes be represented by the bit mask?
+        if _count_bits(bits) == len(recipients):
+            return bits, frozenset()
+
+        return bits, frozenset(
+            index for index in map(
+                recipients.get_recipient_index, range(len(recipients)))
+            if not 0 < index <= _max_bit_index)
+
+    # Was a single index given?
+    if isinstance(recipients, int):
+        recipients = (recipients, )
+
+    bits = 0
+    indexes = set()
+    for index in recipients:
+        if isinstance(index, Player):
+            index = index.index
+
+        if 0 < index <= _max_bit_index:
+            bits |= 1 << (index - 1)
+        else:
+            indexes.add(index)
+
+    return bits, frozenset(indexes)
+
+
+def _count_bits(bits):
+    """Return the number of set bits in the bit mask."""
+    return bin(bits).count('1')
+
+
+def _iter_bits(bits):
+    """Iterate over the indexes of the set bits in the bit mask."""
+    index = 1
+    while bits:
+        if bits & 1:
+            yield index
+
+        bits >>= 1
+        index += 1
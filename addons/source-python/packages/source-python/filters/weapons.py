@@ -11,6 +11,9 @@ from entities import EntityGenerator
 from entities.helpers import index_from_edict
 #   Filters
 from filters.iterator import _IterObject
+#   Listeners
+from listeners import on_entity_created_listener_manager
+from listeners import on_entity_deleted_listener_manager
 #   Weapons
 from weapons.default import NoWeaponManager
 from weapons.manager import weapon_manager
@@ -30,6 +33,12 @@ __all__ = ('WeaponClassIter',
 class WeaponIter(_IterObject):
     """Weapon iterate class."""
 
+    # Store the listener managers invalidating the snapshots
+    _snapshot_listeners = (
+        on_entity_created_listener_manager,
+        on_entity_deleted_listener_manager,
+    )
+
     @staticmethod
     def iterator():
         """Iterate over all :class:`weapons.entity.Weapon` objects."""
@@ -50,6 +59,17 @@ class WeaponIter(_IterObject):
 class WeaponClassIter(_IterObject):
     """Weapon tag iterate class."""
 
+    @property
+    def names(self):
+        """Return a frozenset of the matching weapon names."""
+        names = self._get_tagged_names()
+
+        # Are there any filters that are not tags?
+        if names is None:
+            names = frozenset(weapon.name for weapon in self._iter_items())
+
+        return names
+
     @staticmethod
     def iterator():
         """Iterate over all :class:`weapons.instance.WeaponClass` objects."""
@@ -59,6 +79,34 @@ class WeaponClassIter(_IterObject):
             # Yield the weapon
             yield weapon_manager[weapon]
 
+    def _iter_items(self):
+        """Iterate over the weapons passing the filters."""
+        names = self._get_tagged_names()
+
+        # Are there any filters that are not tags?
+        if names is None:
+            yield from super()._iter_items()
+            return
+
+        for weapon in self.iterator():
+            if weapon.name in names:
+                yield weapon
+
+    def _get_tagged_names(self):
+        """Return the matching weapon names if all filters are tags."""
+        # Is the game not supported?
+        if isinstance(weapon_manager, NoWeaponManager):
+            return None
+
+        for filter_name in (*self.is_filters, *self.not_filters):
+            if (filter_name not in _tag_filters or
+                    self._filters.get(filter_name) is not
+                    _tag_filters[filter_name]):
+                return None
+
+        return weapon_manager.get_tagged_names(
+            self.is_filters, self.not_filters)
+
 
 # =============================================================================
 # >> WEAPON TAG CLASSES
@@ -77,6 +125,9 @@ class _WeaponTags(dict):
 # Get the _WeaponTags instance
 _weapon_tags = _WeaponTags()
 
+# Store the tag filters registered for WeaponClassIter
+_tag_filters = dict()
+
 
 class _Tag(object):
     """Class used to store a tag and compare to a given weapon."""
@@ -111,5 +162,5 @@ if not isinstance(weapon_manager, NoWeaponManager):
             _tag, _instance._tag_exists_for_weapon)
 
         # Register the tag's filter for WeaponClassIter
-        WeaponClassIter.register_filter(
-            _tag, _instance._tag_exists_for_weapon_class)
+        _tag_filters[_tag] = _instance._tag_exists_for_weapon_class
+        WeaponClassIter.register_filter(_tag, _tag_filters[_tag])
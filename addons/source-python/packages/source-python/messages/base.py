@@ -6,14 +6,23 @@
 # >> IMPORTS
 # ============================================================================
 # Python Imports
-import collections
+#   Collections
+from collections import OrderedDict
 
 # Source.Python Imports
 #   Colors
 from colors import WHITE
+#   Entities
+from entities.helpers import index_from_edict
 #   Filters
 from filters.recipients import RecipientFilter
+#   Listeners
+from listeners import on_client_disconnect_listener_manager
+from listeners import on_client_put_in_server_listener_manager
+from listeners import on_client_settings_changed_listener_manager
+from listeners import on_query_cvar_value_finished_listener_manager
 #   Players
+from players import PlayerGenerator
 from players.helpers import get_client_language
 from players.helpers import playerinfo_from_index
 #   Translations
@@ -44,6 +53,10 @@ class AttrDict(dict):
 class UserMessageCreator(AttrDict):
     """Provide an easy interface to create user messages."""
 
+    # The serialized buffers are only cached if enabled
+    _payloads = None
+    _payload_cache_size = 0
+
     def __init__(self, **kwargs):
         """Initialize the usermessage creator.
 
@@ -59,53 +72,132 @@ class UserMessageCreator(AttrDict):
 
         super().__setitem__(item, value)
 
+        # The cached buffers are outdated now
+        self.clear_payload_cache()
+
     def __setattr__(self, attr, value):
         """Set a field value."""
         self[attr] = value
 
+    def enable_payload_cache(self, size=64):
+        """Cache the serialized buffer per language and tokens.
+
+        Sending the message again with the same language and tokens only
+        copies the cached buffer into a new user message. The cache is
+        cleared whenever a field is set. Call :meth:`clear_payload_cache` if
+        a :class:`translations.strings.TranslationStrings` object of the
+        message was changed.
+
+        :param int size: The maximum number of cached buffers.
+        """
+        object.__setattr__(self, '_payloads', OrderedDict())
+        object.__setattr__(self, '_payload_cache_size', size)
+
+    def disable_payload_cache(self):
+        """Stop caching the serialized buffers and remove all of them."""
+        object.__setattr__(self, '_payloads', None)
+
+    def clear_payload_cache(self):
+        """Remove all cached buffers."""
+        if self._payloads is not None:
+            self._payloads.clear()
+
     def send(self, *player_indexes, **tokens):
         """Send the user message."""
         player_indexes = RecipientFilter(*player_indexes)
-        for language, indexes in self._categorize_players_by_language(
+        for language, recipients in self._categorize_players_by_language(
                 player_indexes).items():
+            payload_key = self._get_payload_key(language, tokens)
+
+            # Is the buffer already cached?
+            if self._send_cached_payload(recipients, payload_key):
+                continue
+
             translated_kwargs = AttrDict(self)
             translated_kwargs.update(
                 self._get_translated_kwargs(language, tokens))
-            self._send(indexes, translated_kwargs)
+            self._send(recipients, translated_kwargs, payload_key)
 
-    def _send(self, player_indexes, translated_kwargs):
+    def _send(self, player_indexes, translated_kwargs, payload_key=None):
         """Send the user message to the given players.
 
         :param iterable player_indexes: All players with the same language
             setting.
         :param AttrDict translated_kwargs: The translated arguments.
+        :param payload_key: If not None, the serialized buffer will be
+            cached with this key.
         """
-        user_message = UserMessage(
-            RecipientFilter(*player_indexes), self.message_name)
+        # Was no recipient filter given?
+        if not isinstance(player_indexes, RecipientFilter):
+            player_indexes = RecipientFilter(*player_indexes)
+
+        user_message = UserMessage(player_indexes, self.message_name)
 
         if user_message.is_protobuf():
             self.protobuf(user_message.buffer, translated_kwargs)
         else:
             self.bitbuf(user_message.buffer, translated_kwargs)
 
+        if payload_key is not None:
+            self._store_payload(payload_key, user_message.get_payload())
+
+        user_message.send()
+
+    def _get_payload_key(self, language, tokens):
+        """Return the key to cache the buffer with or None if disabled."""
+        if self._payloads is None:
+            return None
+
+        key = (language, frozenset(tokens.items()))
+
+        # Are all tokens hashable?
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def _send_cached_payload(self, recipients, payload_key):
+        """Send the cached buffer and return whether it was cached."""
+        if payload_key is None:
+            return False
+
+        payload = self._payloads.get(payload_key)
+        if payload is None:
+            return False
+
+        self._payloads.move_to_end(payload_key)
+        user_message = UserMessage(recipients, self.message_name)
+        user_message.set_payload(*payload)
         user_message.send()
+        return True
+
+    def _store_payload(self, payload_key, payload):
+        """Cache the buffer and remove the least recently used ones."""
+        payloads = self._payloads
+        payloads[payload_key] = payload
+        while len(payloads) > self._payload_cache_size:
+            payloads.popitem(last=False)
 
     @staticmethod
     def _categorize_players_by_language(player_indexes):
         """Categorize players by their language.
 
         Return a dict in the following format:
-        {<language>: set([<player index>, ...])}
-        """
-        languages = collections.defaultdict(set)
-        for index in player_indexes:
-            if playerinfo_from_index(index).is_fake_client():
-                # No need to send a user message to bots
-                continue
+        {<language>: <RecipientFilter>}
 
-            languages[get_client_language(index)].add(index)
+        Bots are not added, since there is no need to send them a user
+        message.
+        """
+        # Is the bit mask of the players not available?
+        if not isinstance(player_indexes, RecipientFilter):
+            player_indexes = RecipientFilter(*player_indexes)
 
-        return languages
+        return {
+            language: RecipientFilter.from_bits(bits)
+            for language, bits in _client_languages.split(
+                player_indexes.get_bits()).items()}
 
     def _get_translated_kwargs(self, language, tokens):
         """Return translated and tokenized arguments."""
@@ -143,6 +235,102 @@ class UserMessageCreator(AttrDict):
         raise NotImplementedError('Must be implemented by a subclass.')
 
 
+class _ClientLanguages(dict):
+    """Class used to store the language of all human clients.
+
+    The bit masks of the clients are stored per language, so a recipient
+    filter can be split by language with one intersection per language.
+    Bit 0 represents the client at index 1.
+    """
+
+    def __init__(self):
+        """Store the base attributes."""
+        super().__init__()
+        self._bits = dict()
+
+    def add(self, index):
+        """Store the language of the client or update it."""
+        self.remove(index)
+
+        # Is the client a bot?
+        try:
+            if playerinfo_from_index(index).is_fake_client():
+                return
+        except ValueError:
+            return
+
+        language = self[index] = get_client_language(index)
+        self._bits[language] = self._bits.get(language, 0) | (1 << (index - 1))
+
+    def remove(self, index):
+        """Remove the client's language."""
+        language = self.pop(index, None)
+        if language is None:
+            return
+
+        bits = self._bits[language] & ~(1 << (index - 1))
+        if bits:
+            self._bits[language] = bits
+        else:
+            del self._bits[language]
+
+    def refresh(self):
+        """Store the languages of all clients on the server."""
+        self.clear()
+        self._bits.clear()
+        for edict in PlayerGenerator():
+            self.add(index_from_edict(edict))
+
+    def split(self, bits):
+        """Return the given bit mask split by language.
+
+        :param int bits: The bit mask of the players.
+        :return: A dictionary of ``{<language>: <bit mask>}`` values.
+            Bots are not included.
+        :rtype: dict
+        """
+        languages = dict()
+        for language, language_bits in self._bits.items():
+            common_bits = bits & language_bits
+            if common_bits:
+                languages[language] = common_bits
+
+        return languages
+
+    def _on_client_put_in_server(self, index, name):
+        """Store the language of the new client."""
+        self.add(index)
+
+    def _on_client_disconnect(self, index):
+        """Remove the client's language."""
+        self.remove(index)
+
+    def _on_client_settings_changed(self, index):
+        """Update the client's language, since it might have changed."""
+        if index in self:
+            self.add(index)
+
+    def _on_query_cvar_value_finished(
+            self, cookie, index, status, cvarname, cvarvalue):
+        """Update the client's language once it has been queried."""
+        if cvarname == 'cl_language' and index in self:
+            self.add(index)
+
+# Get the _ClientLanguages instance and register the listeners
+_client_languages = _ClientLanguages()
+on_client_put_in_server_listener_manager.register_listener(
+    _client_languages._on_client_put_in_server)
+on_client_disconnect_listener_manager.register_listener(
+    _client_languages._on_client_disconnect)
+on_client_settings_changed_listener_manager.register_listener(
+    _client_languages._on_client_settings_changed)
+on_query_cvar_value_finished_listener_manager.register_listener(
+    _client_languages._on_query_cvar_value_finished)
+
+# Store the languages of all clients that are already on the server
+_client_languages.refresh()
+
+
 class VGUIMenu(UserMessageCreator):
     """Create a VGUIMenu."""
 
@@ -202,10 +390,10 @@ class ShowMenu(UserMessageCreator):
         # differently, because the maximum size is 255. If the message exceeds
         # this length, we need to sent it in several parts.
         if UserMessage.is_protobuf():
-            user_message = UserMessage(
-                RecipientFilter(*player_indexes), self.message_name)
-            self.protobuf(user_message.buffer, self)
-            user_message.send()
+            recipients = RecipientFilter(*player_indexes)
+            payload_key = self._get_payload_key(None, {})
+            if not self._send_cached_payload(recipients, payload_key):
+                self._send(recipients, self, payload_key)
         else:
             self.bitbuf(player_indexes, self)
 
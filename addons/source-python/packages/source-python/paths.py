@@ -14,6 +14,7 @@ from path import Path
 # >> ALL DECLARATION
 # =============================================================================
 __all__ = ('BASE_PATH',
+           'CACHE_PATH',
            'CFG_PATH',
            'CUSTOM_DATA_PATH',
            'CUSTOM_PACKAGES_DOCS_PATH',
@@ -44,6 +45,9 @@ GAME_PATH = Path(Path(__file__).rsplit('addons', 1)[0])
 # ../addons/source-python
 BASE_PATH = GAME_PATH / 'addons' / 'source-python'
 
+# ../addons/source-python/cache
+CACHE_PATH = BASE_PATH / 'cache'
+
 # ../addons/source-python/docs
 DOCS_PATH = BASE_PATH / 'docs'
 
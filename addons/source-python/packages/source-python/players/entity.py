@@ -16,6 +16,7 @@ from bitbuffers import BitBufferWrite
 from core import SOURCE_ENGINE_BRANCH
 from core import SOURCE_ENGINE
 #   Engines
+from engines.server import global_vars
 from engines.server import server
 from engines.server import engine_server
 from engines.trace import engine_trace
@@ -23,12 +24,17 @@ from engines.trace import ContentMasks
 from engines.trace import GameTrace
 from engines.trace import MAX_TRACE_LENGTH
 from engines.trace import Ray
-from engines.trace import TraceFilterSimple
+from engines.trace import TraceFilterIgnore
 #   Entities
+from entities.classes import server_classes
 from entities.constants import CollisionGroup
 from entities.constants import MoveType
 from entities.constants import TakeDamage
 from entities.entity import Entity
+from entities.helpers import get_field_buffer
+from entities.helpers import index_from_inthandle
+#   Listeners
+from listeners import on_level_init_listener_manager
 #   Mathlib
 from mathlib import Vector
 from mathlib import QAngle
@@ -38,10 +44,8 @@ from memory.hooks import PreHook
 #   Players
 from players import BaseClient
 from players.constants import PlayerStates
-from players.helpers import address_from_playerinfo
+from players.helpers import _player_identities
 from players.helpers import get_client_language
-from players.helpers import playerinfo_from_index
-from players.helpers import uniqueid_from_playerinfo
 from players.games import _GamePlayer
 from players.voice import mute_manager
 from players.weapons import _PlayerWeapons
@@ -67,15 +71,11 @@ class Player(Entity, _GamePlayer, _PlayerWeapons):
         :raise ValueError: Raised if the index is invalid.
         """
         super().__init__(index)
-        object.__setattr__(self, '_playerinfo', None)
 
     @property
     def playerinfo(self):
         """Return the player's :class:`PlayerInfo` object."""
-        if self._playerinfo is None:
-            playerinfo = playerinfo_from_index(self.index)
-            object.__setattr__(self, '_playerinfo', playerinfo)
-        return self._playerinfo
+        return _player_identities.get_identity(self.index, 'playerinfo')
 
     @property
     def userid(self):
@@ -83,7 +83,7 @@ class Player(Entity, _GamePlayer, _PlayerWeapons):
 
         :rtype: int
         """
-        return self.playerinfo.userid
+        return _player_identities.get_identity(self.index, 'userid')
 
     @property
     def steamid(self):
@@ -91,19 +91,22 @@ class Player(Entity, _GamePlayer, _PlayerWeapons):
 
         :rtype: str
         """
-        return self.playerinfo.steamid
+        return _player_identities.get_identity(self.index, 'steamid')
 
     def get_name(self):
         """Return the player's name.
 
         :rtype: str
         """
-        return self.playerinfo.name
+        return _player_identities.get_identity(self.index, 'name')
 
     def set_name(self, name):
         """Set the player's name."""
         self.base_client.set_name(name)
 
+        # Update the stored name
+        _player_identities.add(self.index)
+
     name = property(get_name, set_name)
 
     @property
@@ -120,7 +123,7 @@ class Player(Entity, _GamePlayer, _PlayerWeapons):
     @property
     def uniqueid(self):
         """Return the player's uniqueid."""
-        return uniqueid_from_playerinfo(self.playerinfo)
+        return _player_identities.get_identity(self.index, 'uniqueid')
 
     @property
     def address(self):
@@ -131,7 +134,7 @@ class Player(Entity, _GamePlayer, _PlayerWeapons):
         :return: The IP address. E.g. '127.0.0.1:27015'
         :rtype: str
         """
-        return address_from_playerinfo(self.playerinfo)
+        return _player_identities.get_identity(self.index, 'address')
 
     def is_connected(self):
         """Return whether the player is connected.
@@ -196,7 +199,7 @@ class Player(Entity, _GamePlayer, _PlayerWeapons):
 
         :param ContentMasks mask: Will be passed to the trace filter.
         :param TraceFilter trace_filter: The trace filter to use. If None was
-            given :class:`engines.trace.TraceFilterSimple` will be used.
+            given :class:`engines.trace.TraceFilterIgnore` will be used.
         :rtype: GameTrace
         """
         # Get the eye location of the player
@@ -210,7 +213,7 @@ class Player(Entity, _GamePlayer, _PlayerWeapons):
 
         # Start the trace
         engine_trace.trace_ray(
-            Ray(start_vec, end_vec), mask, TraceFilterSimple(
+            Ray(start_vec, end_vec), mask, TraceFilterIgnore(
                 (self.index,)) if trace_filter is None else trace_filter,
             trace
         )
@@ -619,10 +622,104 @@ class Player(Entity, _GamePlayer, _PlayerWeapons):
         :return: The generator yields :class:`players.entity.Player` objects.
         :rtype: generator
         """
+        for index in sorted(_observer_graph.get_observers(self.index)):
+            yield Player(index)
+
+    @property
+    def observing(self):
+        """Return the player this player is observing.
+
+        :return: The observed player or None if the player is not observing
+            another player.
+        :rtype: Player
+        """
+        index = _observer_graph.get_target(self.index)
+        if index is None:
+            return None
+
+        return Player(index)
+
+
+class _ObserverGraph(object):
+    """Class used to store which players observe which players.
+
+    The graph is rebuilt at most once per tick, when it is accessed. The
+    observer targets of all dead players are read with a single call.
+    """
+
+    def __init__(self):
+        """Store the base attributes."""
+        self._tick = None
+        self._offset = None
+        self._observers = dict()
+        self._targets = dict()
+
+    def get_observers(self, index):
+        """Return a set of the indexes of the players observing the player."""
+        self._refresh()
+        return self._observers.get(index, frozenset())
+
+    def get_target(self, index):
+        """Return the index of the observed player or None."""
+        self._refresh()
+        return self._targets.get(index)
+
+    def _refresh(self):
+        """Rebuild the graph if it was not built during this tick."""
+        tick = global_vars.tick_count
+
+        # Is the graph still up to date?
+        if tick == self._tick:
+            return
+
+        self._tick = tick
+        self._observers.clear()
+        self._targets.clear()
+
         from filters.players import PlayerIter
-        for other in PlayerIter('dead'):
-            if self.inthandle == other.observer_target:
-                yield other
+        indexes = list(PlayerIter('dead').indexes())
+        if not indexes:
+            return
+
+        handles = memoryview(get_field_buffer(
+            indexes, self._get_offset(indexes[0]), 4)).cast('i')
+
+        for index, handle in zip(indexes, handles):
+            try:
+                target = index_from_inthandle(handle)
+            except (ValueError, OverflowError):
+                continue
+
+            # Is the target not a player?
+            if not 0 < target <= global_vars.max_clients:
+                continue
+
+            self._targets[index] = target
+            self._observers.setdefault(target, set()).add(index)
+
+    def _get_offset(self, index):
+        """Return the offset of the observer target property."""
+        # Has the offset already been found?
+        if self._offset is not None:
+            return self._offset
+
+        for server_class in server_classes.get_entity_server_classes(
+                Player(index)):
+            entity_property = server_class.properties.get('m_hObserverTarget')
+            if entity_property is not None:
+                self._offset = entity_property.offset
+                return self._offset
+
+        raise ValueError('Property "m_hObserverTarget" not found for player.')
+
+    def _on_level_init(self, map_name):
+        """Discard the graph, since the tick count restarts."""
+        self._tick = None
+
+# Get the _ObserverGraph instance and register the listener
+_observer_graph = _ObserverGraph()
+on_level_init_listener_manager.register_listener(
+    _observer_graph._on_level_init)
 
 
 # =============================================================================
@@ -8,6 +8,14 @@
 # Source.Python Imports
 #   Engines
 from engines.server import engine_server
+#   Entities
+from entities.helpers import index_from_edict
+#   Listeners
+from listeners import on_client_connect_listener_manager
+from listeners import on_client_disconnect_listener_manager
+from listeners import on_client_put_in_server_listener_manager
+from listeners import on_client_settings_changed_listener_manager
+from listeners import on_network_id_validated_listener_manager
 #   Players
 from players import PlayerGenerator
 from players.games import get_client_language
@@ -94,20 +102,13 @@ def index_from_steamid(steamid):
     :param str steamid: The SteamID to get the index of.
     :rtype: int
     """
-    # Loop through all players on the server
-    for edict in PlayerGenerator():
+    index = _player_identities.get_index('steamid', steamid)
+    if index is None:
+        raise ValueError(
+            'Conversion from "SteamID" ({}) to "Index" failed.'.format(
+                steamid))
 
-        # Get the PlayerInfo instance of the player...
-        playerinfo = playerinfo_from_edict(edict)
-
-        # Is the current player's SteamID the same as the one given?
-        if playerinfo.steamid == steamid:
-
-            # Return the index of the current player
-            return index_from_playerinfo(playerinfo)
-
-    raise ValueError(
-        'Conversion from "SteamID" ({}) to "Index" failed.'.format(steamid))
+    return index
 
 
 def index_from_uniqueid(uniqueid):
@@ -116,20 +117,13 @@ def index_from_uniqueid(uniqueid):
     :param str uniqueid: The UniqueID to get the index of.
     :rtype: int
     """
-    # Loop through all players on the server
-    for edict in PlayerGenerator():
-
-        # Get the PlayerInfo instance of the player...
-        playerinfo = playerinfo_from_edict(edict)
-
-        # Is the current player's UniqueID the same as the one given?
-        if uniqueid_from_playerinfo(playerinfo) == uniqueid:
+    index = _player_identities.get_index('uniqueid', uniqueid)
+    if index is None:
+        raise ValueError(
+            'Conversion from "UniqueID" ({}) to "Index" failed.'.format(
+                uniqueid))
 
-            # Return the index of the current player
-            return index_from_playerinfo(playerinfo)
-
-    raise ValueError(
-        'Conversion from "UniqueID" ({}) to "Index" failed.'.format(uniqueid))
+    return index
 
 
 def index_from_name(name):
@@ -138,20 +132,12 @@ def index_from_name(name):
     :param str name: The player name to get the index of.
     :rtype: int
     """
-    # Loop through all players on the server
-    for edict in PlayerGenerator():
-
-        # Get the PlayerInfo instance of the player...
-        playerinfo = playerinfo_from_edict(edict)
-
-        # Is the current player's name the same as the one given?
-        if playerinfo.name == name:
-
-            # Return the index of the current player
-            return index_from_playerinfo(playerinfo)
+    index = _player_identities.get_index('name', name)
+    if index is None:
+        raise ValueError(
+            'Conversion from "Name" ({}) to "Index" failed.'.format(name))
 
-    raise ValueError(
-        'Conversion from "Name" ({}) to "Index" failed.'.format(name))
+    return index
 
 
 def uniqueid_from_playerinfo(playerinfo):
@@ -219,3 +205,204 @@ def address_from_playerinfo(playerinfo):
 
     # Return the player's IP Address
     return netinfo.address
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _PlayerIdentities(dict):
+    """Class used to map the identities of all players to their index.
+
+    The identities are stored as ``{<index>: {<kind>: <value>}}`` and
+    are updated by listeners. Every lookup is verified against the
+    player's current PlayerInfo, so a missed update can't return a wrong
+    index.
+
+    Besides the kinds that can be looked up, the PlayerInfo, userid and
+    address of each player are stored, since they don't change while the
+    player is connected.
+    """
+
+    # Store the kinds of identities and how to get them from a PlayerInfo
+    _kinds = {
+        'steamid': lambda playerinfo: playerinfo.steamid,
+        'uniqueid': uniqueid_from_playerinfo,
+        'name': lambda playerinfo: playerinfo.name,
+    }
+
+    def __init__(self):
+        """Store the base attributes."""
+        super().__init__()
+        self._indexes = {kind: dict() for kind in self._kinds}
+        self._disconnecting = set()
+
+    def add(self, index):
+        """Store the identities of the player."""
+        self.remove(index)
+
+        # Is the player disconnecting? The identities would be kept for
+        #   the next client in the slot otherwise.
+        if index in self._disconnecting:
+            return
+
+        identities = self._get_identities(index)
+        if identities is None:
+            return
+
+        self[index] = identities
+
+        # Store all indexes, since multiple players can share an identity
+        for kind in self._kinds:
+            self._indexes[kind].setdefault(identities[kind], set()).add(index)
+
+    def remove(self, index):
+        """Remove the identities of the player."""
+        identities = self.pop(index, None)
+        if identities is None:
+            return
+
+        for kind in self._kinds:
+            value = identities[kind]
+            indexes = self._indexes[kind].get(value)
+            if indexes is None:
+                continue
+
+            indexes.discard(index)
+            if not indexes:
+                del self._indexes[kind][value]
+
+    def get_identity(self, index, name):
+        """Return the stored identity value of the player.
+
+        :param int index: The index of the player.
+        :param str name: The name of the value (e.g. 'steamid' or
+            'userid').
+        :raise ValueError: Raised if the index is not a valid player.
+        """
+        identities = self.get(index)
+
+        # Were the identities of the player not stored yet?
+        if identities is None:
+            self.add(index)
+            identities = self.get(index)
+
+            # Is the player disconnecting?
+            if identities is None and index in self._disconnecting:
+                identities = self._get_identities(index)
+
+            if identities is None:
+                raise ValueError(
+                    'Conversion from "Index" ({}) to "PlayerInfo" '
+                    'failed.'.format(index))
+
+        return identities[name]
+
+    def refresh(self):
+        """Store the identities of all players on the server."""
+        self.clear()
+        for indexes in self._indexes.values():
+            indexes.clear()
+
+        for edict in PlayerGenerator():
+            self.add(index_from_edict(edict))
+
+    def get_index(self, kind, value):
+        """Return the lowest index of a player with the identity or None."""
+        indexes = self._indexes[kind].get(value)
+
+        # Is one of the stored indexes still valid?
+        if indexes:
+            for index in sorted(indexes):
+                if self._is_current(index, kind, value):
+                    return index
+
+            # Update all identities, since the stored ones are outdated
+            self.refresh()
+
+        # Store the players that were not put in the server yet
+        else:
+            self._add_missing()
+
+        indexes = self._indexes[kind].get(value)
+        return min(indexes) if indexes else None
+
+    def _add_missing(self):
+        """Store the identities of all players that are not stored yet."""
+        for edict in PlayerGenerator():
+            index = index_from_edict(edict)
+            if index not in self:
+                self.add(index)
+
+    def _get_identities(self, index):
+        """Return the current identities of the player or None."""
+        try:
+            playerinfo = playerinfo_from_index(index)
+        except ValueError:
+            return None
+
+        identities = {
+            kind: function(playerinfo)
+            for kind, function in self._kinds.items()}
+
+        # Store the values that can't be looked up
+        identities.update(
+            playerinfo=playerinfo,
+            userid=playerinfo.userid,
+            address=address_from_playerinfo(playerinfo))
+
+        return identities
+
+    def _is_current(self, index, kind, value):
+        """Return whether the player still has the given identity."""
+        try:
+            playerinfo = playerinfo_from_index(index)
+        except ValueError:
+            return False
+
+        return self._kinds[kind](playerinfo) == value
+
+    def _on_client_connect(
+            self, allow_connect_ptr, index, name, address, reject_msg_ptr,
+            max_reject_len):
+        """Remove the identities of the previous client in the slot."""
+        self._disconnecting.discard(index)
+        self.remove(index)
+
+    def _on_client_put_in_server(self, index, name):
+        """Store the identities of the new player."""
+        self._disconnecting.discard(index)
+        self.add(index)
+
+    def _on_client_disconnect(self, index):
+        """Remove the identities of the player.
+
+        Until the next client uses the slot, the identities are read from
+        the current PlayerInfo, so later disconnect listeners don't store
+        them again.
+        """
+        self._disconnecting.add(index)
+        self.remove(index)
+
+    def _on_client_settings_changed(self, index):
+        """Update the identities of the player (e.g. a changed name)."""
+        self.add(index)
+
+    def _on_network_id_validated(self, name, network_id):
+        """Update all identities, since the player's SteamID changed."""
+        self.refresh()
+
+# Get the _PlayerIdentities instance and register the listeners
+_player_identities = _PlayerIdentities()
+on_client_connect_listener_manager.register_listener(
+    _player_identities._on_client_connect)
+on_client_put_in_server_listener_manager.register_listener(
+    _player_identities._on_client_put_in_server)
+on_client_disconnect_listener_manager.register_listener(
+    _player_identities._on_client_disconnect)
+on_client_settings_changed_listener_manager.register_listener(
+    _player_identities._on_client_settings_changed)
+on_network_id_validated_listener_manager.register_listener(
+    _player_identities._on_network_id_validated)
+
+# Store the identities of all players that are already on the server
+_player_identities.refresh()
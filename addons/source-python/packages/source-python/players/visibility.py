@@ -0,0 +1,161 @@
+# ../players/visibility.py
+
+"""Provides a shared line of sight matrix of all living players."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Source.Python Imports
+#   Engines
+from engines.server import engine_server
+from engines.server import global_vars
+from engines.trace import ContentMasks
+from engines.trace import TraceFilterIgnore
+from engines.trace import engine_trace
+#   Filters
+from filters.players import PlayerIter
+#   Players
+from players.entity import Player
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ('visibility_matrix',
+           )
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _VisibilityMatrix(object):
+    """Class used to share the line of sight between all living players.
+
+    The matrix is only rebuilt when it is queried and at least ``interval``
+    ticks have passed since the last rebuild. Pairs of players that are not
+    in each other's PVS are not traced at all. All other pairs are traced
+    from eye to eye in a single :meth:`engines.trace._EngineTrace.trace_rays`
+    call. Players don't block the line of sight.
+
+    Example:
+
+    .. code:: python
+
+        from players.visibility import visibility_matrix
+
+        def is_suspicious(attacker, victim):
+            return not visibility_matrix.can_see(attacker.index, victim.index)
+    """
+
+    def __init__(self):
+        """Store the base attributes."""
+        self.interval = 1
+        self.mask = ContentMasks.VISIBLE
+        self._tick = None
+        self._rows = dict()
+
+    def can_see(self, index, other):
+        """Return whether the players have a line of sight to each other.
+
+        :param int index: The index of the first player.
+        :param int other: The index of the second player.
+        :rtype: bool
+        """
+        return bool(self._get_rows().get(index, 0) >> other & 1)
+
+    def get_visible_indexes(self, index):
+        """Yield the indexes of all players the given player can see.
+
+        :param int index: The index of the player.
+        """
+        row = self._get_rows().get(index, 0)
+        other = 0
+        while row:
+            if row & 1:
+                yield other
+
+            row >>= 1
+            other += 1
+
+    def get_row(self, index):
+        """Return the visibility bits of the given player.
+
+        Bit ``n`` is set if the player can see the player at index ``n``.
+
+        :param int index: The index of the player.
+        :rtype: int
+        """
+        return self._get_rows().get(index, 0)
+
+    def invalidate(self):
+        """Force a rebuild of the matrix on the next query."""
+        self._tick = None
+
+    def _get_rows(self):
+        """Return the rows of the matrix and rebuild them if outdated."""
+        tick = global_vars.tick_count
+
+        # Is the matrix still up to date?
+        if self._tick is not None and 0 <= tick - self._tick < self.interval:
+            return self._rows
+
+        self._tick = tick
+        self._rows = self._build_rows()
+        return self._rows
+
+    def _build_rows(self):
+        """Trace all pairs of living players within each other's PVS."""
+        indexes = list(PlayerIter('alive').indexes())
+        eyes = [Player(index).eye_location for index in indexes]
+        clusters = [engine_server.get_cluster_for_origin(eye) for eye in eyes]
+
+        # Get the PVS of each occupied cluster only once
+        visible_sets = dict()
+        for cluster, eye in zip(clusters, eyes):
+            if cluster not in visible_sets:
+                visible_sets[cluster] = engine_server.get_pvs_for_origin(eye)
+
+        # Find all pairs that need to be traced. Since the traces are from
+        # eye to eye, the line of sight is symmetric.
+        pairs = list()
+        rays = list()
+        for position, cluster in enumerate(clusters):
+            pvs = visible_sets[cluster]
+            for other_position in range(position + 1, len(indexes)):
+                other_cluster = clusters[other_position]
+                if not _in_pvs(pvs, other_cluster):
+                    continue
+
+                pairs.append((indexes[position], indexes[other_position]))
+                rays.append((eyes[position], eyes[other_position]))
+
+        rows = dict.fromkeys(indexes, 0)
+        if not rays:
+            return rows
+
+        fractions = engine_trace.trace_rays(
+            rays, self.mask,
+            TraceFilterIgnore(exclude_classnames=('player',)))['fraction']
+
+        for (index, other), fraction in zip(pairs, fractions):
+            if fraction == 1.0:
+                rows[index] |= 1 << other
+                rows[other] |= 1 << index
+
+        return rows
+
+# The singleton object of the :class:`_VisibilityMatrix` class
+visibility_matrix = _VisibilityMatrix()
+
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _in_pvs(pvs, cluster):
+    """Return whether the cluster is set in the given PVS bytes."""
+    # Is the position outside of the map?
+    if cluster < 0:
+        return False
+
+    byte = cluster >> 3
+    return byte < len(pvs) and bool(pvs[byte] & (1 << (cluster & 7)))
@@ -7,8 +7,10 @@
 # =============================================================================
 # Source.Python Imports
 #   Entities
+from entities.classes import server_classes
+from entities.entity import BaseEntity
 from entities.entity import Entity
-from entities.helpers import edict_from_index
+from entities.helpers import get_handle_array
 from entities.helpers import index_from_inthandle
 from entities.props import SendPropType
 #   Engines
@@ -58,12 +60,10 @@ class _PlayerWeapons(object):
             # Return 0 as the amount
             return 0
 
-        # Get the Entity instance for the index
-        weapon = Entity(index)
-
         # Return the amount of ammo the player has for the weapon
         return self.get_property_int(
-            weapon_manager.ammoprop + '%03d' % weapon.ammoprop)
+            weapon_manager.ammoprop + '%03d' % _get_weapon_attribute(
+                index, 'ammoprop'))
 
     # =========================================================================
     # >> GET CLIP
@@ -99,11 +99,8 @@ class _PlayerWeapons(object):
             # Return 0 as the amount
             return 0
 
-        # Get the Entity instance for the index
-        weapon = Entity(index)
-
         # Return the amount of ammo in the weapon's clip
-        return weapon.clip
+        return _get_weapon_attribute(index, 'clip')
 
     # =========================================================================
     # >> SET AMMO
@@ -142,12 +139,10 @@ class _PlayerWeapons(object):
                 '"{0}, {1}, {2}" for player "{3}"'.format(
                     classname, is_filters, not_filters, self.userid))
 
-        # Get the entity's Entity instance
-        weapon = Entity(index)
-
         # Set the player's ammo value
         self.set_property_int(
-            weapon_manager.ammoprop + '%03d' % weapon.ammoprop, value)
+            weapon_manager.ammoprop + '%03d' % _get_weapon_attribute(
+                index, 'ammoprop'), value)
 
     # =========================================================================
     # >> SET CLIP
@@ -186,11 +181,8 @@ class _PlayerWeapons(object):
                 '"{0}, {1}, {2}" for player "{3}"'.format(
                     classname, is_filters, not_filters, self.userid))
 
-        # Get the entity's Entity instance
-        weapon = Entity(index)
-
         # Set the weapon's clip value
-        weapon.clip = value
+        _set_weapon_attribute(index, 'clip', value)
 
     # =========================================================================
     # >> ADD AMMO
@@ -229,17 +221,15 @@ class _PlayerWeapons(object):
                 '"{0}, {1}, {2}" for player "{3}"'.format(
                     classname, is_filters, not_filters, self.userid))
 
-        # Get the entity's Entity instance
-        weapon = Entity(index)
+        # Get the name of the ammo property
+        ammoprop = weapon_manager.ammoprop + '%03d' % _get_weapon_attribute(
+            index, 'ammoprop')
 
         # Get the current ammo value
-        current = self.get_property_int(
-            weapon_manager.ammoprop + '%03d' % weapon.ammoprop)
+        current = self.get_property_int(ammoprop)
 
         # Add ammo to the current value
-        self.set_property_int(
-            weapon_manager.ammoprop + '%03d' % weapon.ammoprop,
-            current + value)
+        self.set_property_int(ammoprop, current + value)
 
     # =========================================================================
     # >> ADD CLIP
@@ -278,11 +268,9 @@ class _PlayerWeapons(object):
                 '"{0}, {1}, {2}" for player "{3}"'.format(
                     classname, is_filters, not_filters, self.userid))
 
-        # Get the entity's Entity instance
-        weapon = Entity(index)
-
         # Add ammo to the weapon's clip
-        weapon.clip += value
+        _set_weapon_attribute(
+            index, 'clip', _get_weapon_attribute(index, 'clip') + value)
 
     # =========================================================================
     # >> WEAPON INDEXES
@@ -313,6 +301,18 @@ class _PlayerWeapons(object):
         """Return a list of weapon indexes for the player."""
         return list(self.weapon_indexes(classname, is_filters, not_filters))
 
+    def get_weapon_handles(self):
+        """Return (<index>, <classname>) tuples of all held weapons.
+
+        The whole weapon array is read with a single call.
+        """
+        # Is the weapon array supported for the current game?
+        if _weapon_prop_length is None:
+            return []
+
+        return get_handle_array(
+            self.index, _get_weapons_offset(self), _weapon_prop_length)
+
     def weapon_indexes(
             self, classname=None, is_filters=None, not_filters=None):
         """Iterate over all currently held weapons by thier index."""
@@ -320,20 +320,17 @@ class _PlayerWeapons(object):
         if _weapon_prop_length is None:
             return
 
-        # Loop through the length of the weapon array
-        for offset in range(_weapon_prop_length):
-
-            # Get the player's current weapon at this offset
-            handle = self.get_property_int(
-                weapon_manager.myweapons + '%03i' % offset)
+        # Get the names of the weapons matching the filters
+        if is_filters is None and not_filters is None:
+            weapon_names = None
+        else:
+            # Import WeaponClassIter to use its functionality
+            from filters.weapons import WeaponClassIter
 
-            try:
-                index = index_from_inthandle(handle)
-            except (ValueError, OverflowError):
-                continue
+            weapon_names = WeaponClassIter(is_filters, not_filters).names
 
-            # Get the weapon's classname
-            weapon_class = edict_from_index(index).classname
+        # Loop through all weapons of the player
+        for index, weapon_class in self.get_weapon_handles():
 
             # Was a classname given and the current
             # weapon is not of that classname?
@@ -342,18 +339,12 @@ class _PlayerWeapons(object):
                 # Do not yield this index
                 continue
 
-            # Import WeaponClassIter to use its functionality
-            from filters.weapons import WeaponClassIter
-
             # Was a weapon type given and the
             # current weapon is not of that type?
-            if not (is_filters is None and not_filters is None):
-                if weapon_class not in map(
-                        lambda value: value.name,
-                        WeaponClassIter(is_filters, not_filters)):
+            if weapon_names is not None and weapon_class not in weapon_names:
 
-                    # Do not yield this index
-                    continue
+                # Do not yield this index
+                continue
 
             # Yield the index
             yield index
@@ -385,6 +376,35 @@ class _PlayerWeapons(object):
 # =============================================================================
 # >> HELPER FUNCTIONS
 # =============================================================================
+def _get_weapons_offset(player):
+    """Return the offset of the player's weapon array."""
+    global _weapons_offset
+
+    # Has the offset already been found?
+    if _weapons_offset is not None:
+        return _weapons_offset
+
+    # Loop through all server classes of the player
+    name = weapon_manager.myweapons + '000'
+    for server_class in server_classes.get_entity_server_classes(player):
+        entity_property = server_class.properties.get(name)
+        if entity_property is not None:
+            _weapons_offset = entity_property.offset
+            return _weapons_offset
+
+    raise ValueError('Property "{0}" not found for player.'.format(name))
+
+
+def _get_weapon_attribute(index, name):
+    """Return the attribute of the weapon without wrapping it in Entity."""
+    return server_classes.get_entity_attribute(BaseEntity(index), name)
+
+
+def _set_weapon_attribute(index, name, value):
+    """Set the attribute of the weapon without wrapping it in Entity."""
+    server_classes.set_entity_attribute(BaseEntity(index), name, value)
+
+
 def _find_weapon_prop_length(table):
     """Loop through a prop table to find the myweapons property length."""
     # Loop through the props in the table
@@ -402,8 +422,9 @@ def _find_weapon_prop_length(table):
             # Loop through the table
             _find_weapon_prop_length(item.data_table)
 
-# Default the weapon prop length to None
+# Default the weapon prop length and offset to None
 _weapon_prop_length = None
+_weapons_offset = None
 
 # Is the game supported?
 if not isinstance(weapon_manager, NoWeaponManager):
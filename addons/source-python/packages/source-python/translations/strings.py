@@ -10,9 +10,17 @@
 from binascii import unhexlify
 #   Codecs
 from codecs import unicode_escape_decode
+#   Collections
+from collections import OrderedDict
+#   Marshal
+import marshal
+#   OS
+from os import replace
 #   Re
 from re import compile as re_compile
 from re import VERBOSE
+#   String
+from string import Formatter
 
 # Site-Package Imports
 #   Configobj
@@ -20,10 +28,14 @@ from configobj import Section
 
 # Source.Python Imports
 #   Core
+from core import GAME_NAME
 from core import GameConfigObj
+from core import SOURCE_ENGINE
 #   Paths
+from paths import CACHE_PATH
 from paths import TRANSLATION_PATH
 from paths import GAME_PATH
+from paths import SP_DATA_PATH
 #   Translations
 from translations.manager import language_manager
 
@@ -44,6 +56,33 @@ _double_escaped_pattern = re_compile(
     r"""(\\(?:(?P<octal>[0-7]{1,3})|x(?P<hexadecimal>[0-9|a-f|A-F]{2})|
     (?P<notation>a|b|e|f|n|r|s|t|v)))""", VERBOSE)
 
+# Get the path to store the parsed translation files at
+_strings_cache_path = CACHE_PATH / 'translations'
+
+# Store the version of the strings cache format
+_strings_cache_version = 1
+
+# Get the path to the known languages, since they affect the parsed strings
+_languages_path = SP_DATA_PATH / 'languages.ini'
+
+# Get a Formatter instance to parse the translation templates
+_formatter = Formatter()
+
+# Store the most recently compiled templates as
+#   {<template>: (<field names>, <text>)}
+_compiled_templates = OrderedDict()
+_compiled_templates_size = 1024
+
+# Store the most recently rendered strings
+_rendered_strings = OrderedDict()
+_rendered_strings_size = 1024
+
+# Store the token types that can't change their string representation
+_cacheable_types = frozenset({str, int, float, bool, type(None)})
+
+# Get a sentinel object for tokens that were not given
+_missing = object()
+
 
 # =============================================================================
 # >> CLASSES
@@ -70,17 +109,76 @@ class LangStrings(dict):
         self._serverfile = self._mainfile.parent / '{0}_server.ini'.format(
             self._mainfile.namebase)
 
-        # Get the strings from the main file
-        main_strings = GameConfigObj(self._mainfile, encoding=encoding)
-
-        # Does the server specific file exist?
+        # Does the server specific file need to be created?
         if not self._serverfile.isfile() and not infile.startswith('_core/'):
 
             # Create the server specific file
             self._create_server_file()
 
-        # Otherwise
-        else:
+        # Try to get the parsed strings from the cache
+        cache_path = _strings_cache_path / infile + '.bin'
+        cache_key = self._get_cache_key(encoding)
+        cached = _load_cached_strings(cache_path, cache_key)
+
+        # Were the files changed since they were cached?
+        if cached is None:
+
+            # Parse the files and cache the result
+            cached = self._parse_files(encoding)
+            _save_cached_strings(cache_path, cache_key, cached)
+
+        strings, default_language = cached
+
+        # Loop through all strings
+        for key, languages in strings.items():
+
+            # Get a TranslationStrings instance for the current string
+            translation_strings = TranslationStrings()
+            translation_strings.update(languages)
+
+            # Add the TranslationStrings instance for the current string
+            self[key] = translation_strings
+
+        # Is there any default language specified into the main file?
+        if default_language is not None:
+
+            # Set the default language
+            self.default_language = default_language
+
+    def __setattr__(self, attribute, value):
+        """Register the default language."""
+        # Is the given attribute the default language?
+        if attribute == 'default_language':
+
+            # Get the given language code
+            language_code = language_manager.get_language(value)
+
+            # Is the given language code valid?
+            if language_code is not None:
+
+                # Loop through all strings
+                for key in self:
+
+                    # Set the default language to use for that string
+                    self[key]._default_language = language_code
+
+                # Override the given value
+                value = language_code
+
+        # Set the attribute
+        super().__setattr__(attribute, value)
+
+    def _parse_files(self, encoding):
+        """Return the strings and the default language of the files.
+
+        The strings are returned as ``{<key>: {<language>: <string>}}``
+        values and the default language is None if it was not given.
+        """
+        # Get the strings from the main file
+        main_strings = GameConfigObj(self._mainfile, encoding=encoding)
+
+        # Does the server specific file exist?
+        if self._serverfile.isfile():
 
             # Get any strings from the server specific file
             server_strings = GameConfigObj(self._serverfile, encoding=encoding)
@@ -88,6 +186,8 @@ class LangStrings(dict):
             # Merge the two ConfigObj instances together
             main_strings.merge(server_strings)
 
+        strings = dict()
+
         # Loop through all strings
         for key in main_strings:
 
@@ -97,8 +197,7 @@ class LangStrings(dict):
                 # No need to go further
                 continue
 
-            # Get a TranslationStrings instance for the current string
-            translation_strings = TranslationStrings()
+            languages = strings[key] = dict()
 
             # Loop through all languages for the current string
             for lang in main_strings[key]:
@@ -114,56 +213,42 @@ class LangStrings(dict):
                     continue
 
                 # Get the language's string and fix any escaped strings
-                translation_strings[
-                    language] = self._replace_escaped_sequences(
+                languages[language] = self._replace_escaped_sequences(
                     main_strings[key][lang])
 
-            # Add the TranslationStrings instance for the current string
-            self[key] = translation_strings
+        default_language = None
 
         # Is there any default language specified into the main file?
         if 'DEFAULT_LANGUAGE' in main_strings:
 
-            # Get the default language
-            default_language = main_strings['DEFAULT_LANGUAGE']
-
             # Make sure it is not a Section
-            if not isinstance(default_language, Section):
+            if not isinstance(main_strings['DEFAULT_LANGUAGE'], Section):
 
                 # Get the given language code
-                language_code = language_manager.get_language(default_language)
-
-                # Is the language valid?
-                if language_code is not None:
-
-                    # Set the default language
-                    self.default_language = language_code
-
-                # Delete the key from the main file as we are done with it
-                del main_strings['DEFAULT_LANGUAGE']
-
-    def __setattr__(self, attribute, value):
-        """Register the default language."""
-        # Is the given attribute the default language?
-        if attribute == 'default_language':
-
-            # Get the given language code
-            language_code = language_manager.get_language(value)
-
-            # Is the given language code valid?
-            if language_code is not None:
-
-                # Loop through all strings
-                for key in self:
-
-                    # Set the default language to use for that string
-                    self[key]._default_language = language_code
-
-                # Override the given value
-                value = language_code
+                default_language = language_manager.get_language(
+                    main_strings['DEFAULT_LANGUAGE'])
+
+        return strings, default_language
+
+    def _get_cache_key(self, encoding):
+        """Return the key used to validate the cached strings.
+
+        The key changes as soon as one of the files, their engine or game
+        specific files or the known languages are changed.
+        """
+        key = [_strings_cache_version, encoding]
+        for path in (
+                *_get_game_config_paths(self._mainfile),
+                *_get_game_config_paths(self._serverfile),
+                _languages_path):
+            try:
+                stat = path.stat()
+            except OSError:
+                key.append(None)
+            else:
+                key.append((stat.st_mtime_ns, stat.st_size))
 
-        # Set the attribute
-        super().__setattr__(attribute, value)
+        return tuple(key)
 
     def _create_server_file(self):
         """Create a server specific langstrings file."""
@@ -231,9 +316,51 @@ class TranslationStrings(dict):
         """Store an empty dictionary as the tokens."""
         super().__init__()
         self.tokens = {}
+        self._languages = {}
+
+    def __setitem__(self, language, string):
+        """Store the string and discard the resolved languages."""
+        super().__setitem__(language, string)
+        self._languages.clear()
+
+    def __delitem__(self, language):
+        """Remove the string and discard the resolved languages."""
+        super().__delitem__(language)
+        self._languages.clear()
+
+    def clear(self):
+        """Remove all strings and discard the resolved languages."""
+        super().clear()
+        self._languages.clear()
+
+    def pop(self, *args):
+        """Remove the string and discard the resolved languages."""
+        string = super().pop(*args)
+        self._languages.clear()
+        return string
+
+    def popitem(self):
+        """Remove a string and discard the resolved languages."""
+        item = super().popitem()
+        self._languages.clear()
+        return item
+
+    def setdefault(self, language, string=None):
+        """Store the string if needed and discard the resolved languages."""
+        string = super().setdefault(language, string)
+        self._languages.clear()
+        return string
+
+    def update(self, *args, **kwargs):
+        """Store the strings and discard the resolved languages."""
+        super().update(*args, **kwargs)
+        self._languages.clear()
 
     def get_string(self, language=None, **tokens):
-        """Return the language string for the given language/tokens."""
+        """Return the language string for the given language/tokens.
+
+        The given tokens override the stored tokens for this call only.
+        """
         # Was no language passed?
         if language is None:
 
@@ -250,14 +377,34 @@ class TranslationStrings(dict):
             # Possibly raise an error silently here
             return ''
 
-        # Update the stored tokens with the given ones
-        self.tokens.update(tokens)
+        # Merge the given tokens without changing the stored tokens
+        if tokens:
+            tokens = dict(self.tokens, **tokens)
+        else:
+            tokens = self.tokens
 
         # Return the formatted message
-        return self[language].format(**self.tokens)
+        return _render(self[language], tokens)
 
     def get_language(self, language):
         """Return the language to be used."""
+        # Has the language already been resolved?
+        key = (
+            language, language_manager.default,
+            getattr(self, '_default_language', None))
+
+        try:
+            return self._languages[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return self._resolve_language(language)
+
+        resolved = self._languages[key] = self._resolve_language(language)
+        return resolved
+
+    def _resolve_language(self, language):
+        """Return the language to be used without the cache."""
         # Get the given language's shortname
         language = language_manager.get_language(language)
 
@@ -291,5 +438,113 @@ class TranslationStrings(dict):
         # Return None as the language, as no language has been found
         return None
 
+
+# =============================================================================
+# >> HELPER FUNCTIONS
+# =============================================================================
+def _get_game_config_paths(path):
+    """Return the paths of all files GameConfigObj merges for the path."""
+    engine_path = path.parent / SOURCE_ENGINE
+    return (
+        path, engine_path / path.name, engine_path / GAME_NAME / path.name)
+
+
+def _load_cached_strings(path, key):
+    """Return the cached strings or None if they are outdated."""
+    try:
+        with path.open('rb') as open_file:
+            cached_key, cached = marshal.load(open_file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    # Is the cache outdated?
+    if cached_key != key:
+        return None
+
+    return cached
+
+
+def _save_cached_strings(path, key, cached):
+    """Write the strings to the cache file."""
+    # Write to a temporary file first, so a crash can't corrupt the cache
+    try:
+        path.parent.makedirs_p()
+        temp_path = path + '.tmp'
+        with temp_path.open('wb') as open_file:
+            marshal.dump((key, cached), open_file)
+
+        replace(temp_path, path)
+    except OSError:
+        pass
+
+
+def _compile_template(template):
+    """Return the (<field names>, <text>) values of the template.
+
+    The text is only given if the template has no replacement fields.
+    """
+    compiled = _compiled_templates.get(template)
+    if compiled is not None:
+        _compiled_templates.move_to_end(template)
+        return compiled
+
+    field_names = dict()
+    literals = list()
+    templates = [template]
+    while templates:
+        for literal, field_name, format_spec, _ in _formatter.parse(
+                templates.pop()):
+            literals.append(literal)
+            if field_name is None:
+                continue
+
+            # Only the first part of e.g. "player.name" is a token
+            field_names[field_name.partition('.')[0].partition('[')[0]] = None
+
+            # Are there nested replacement fields in the format spec?
+            if format_spec:
+                templates.append(format_spec)
+
+    compiled = _compiled_templates[template] = (
+        tuple(field_names), None if field_names else ''.join(literals))
+    if len(_compiled_templates) > _compiled_templates_size:
+        _compiled_templates.popitem(last=False)
+
+    return compiled
+
+
+def _render(template, tokens):
+    """Return the formatted template using the rendered strings cache."""
+    field_names, text = _compile_template(template)
+
+    # Are there no replacement fields?
+    if text is not None:
+        return text
+
+    # Can the result be cached? Types are part of the key, since e.g.
+    # True == 1, but they are formatted differently. The same applies to
+    # 0.0 == -0.0, so floats are stored by their representation.
+    key = [template]
+    for field_name in field_names:
+        value = tokens.get(field_name, _missing)
+        value_type = type(value)
+        if value_type not in _cacheable_types:
+            return template.format(**tokens)
+
+        key.append((
+            value_type, repr(value) if value_type is float else value))
+
+    key = tuple(key)
+    result = _rendered_strings.get(key)
+    if result is not None:
+        _rendered_strings.move_to_end(key)
+        return result
+
+    result = _rendered_strings[key] = template.format(**tokens)
+    if len(_rendered_strings) > _rendered_strings_size:
+        _rendered_strings.popitem(last=False)
+
+    return result
+
 # Get the translations language strings
 _translation_strings = LangStrings('_core/translations_strings')
@@ -5,6 +5,10 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
+# Python Imports
+#   Collections
+from collections import defaultdict
+
 # Site-Package Imports
 #   Configobj
 from configobj import ConfigObj
@@ -69,6 +73,9 @@ class _WeaponManager(dict):
         # Store tags as a set
         self._tags = set()
 
+        # Store the weapon names of each tag
+        tag_index = defaultdict(set)
+
         # Loop through all weapons
         for basename in ini['weapons']:
 
@@ -81,6 +88,17 @@ class _WeaponManager(dict):
             # Add the weapon's tags to the set of tags
             self._tags.update(self[name].tags)
 
+            # Add the weapon to the index of its tags
+            for tag in self[name].tags:
+                tag_index[tag].add(name)
+
+        # Store the index with immutable sets
+        self._tag_index = {
+            tag: frozenset(names) for tag, names in tag_index.items()}
+
+        # Store the weapon names of tag combinations once they are requested
+        self._tag_combinations = dict()
+
     def __getitem__(self, item):
         """Return the WeaponClass instance for the given weapon."""
         # Format the weapon's name
@@ -97,6 +115,39 @@ class _WeaponManager(dict):
         # Return whether the weapon is in the dictionary
         return super().__contains__(name)
 
+    def get_tagged_names(self, is_tags=None, not_tags=None):
+        """Return the names of the weapons matching the given tags.
+
+        :param str/iterable is_tags: The tags a weapon needs to have all of.
+        :param str/iterable not_tags: The tags a weapon must not have.
+        :rtype: frozenset
+        """
+        # Were the tags given as strings?
+        if isinstance(is_tags, str):
+            is_tags = [is_tags]
+
+        if isinstance(not_tags, str):
+            not_tags = [not_tags]
+
+        key = (
+            frozenset(() if is_tags is None else is_tags),
+            frozenset(() if not_tags is None else not_tags))
+
+        # Was the combination already requested?
+        names = self._tag_combinations.get(key)
+        if names is not None:
+            return names
+
+        names = frozenset(super().keys())
+        for tag in key[0]:
+            names &= self._tag_index.get(tag, frozenset())
+
+        for tag in key[1]:
+            names -= self._tag_index.get(tag, frozenset())
+
+        self._tag_combinations[key] = names
+        return names
+
     def _format_name(self, item):
         """Format the name to include the game's weapon prefix."""
         # Set the weapon to lower-case
@@ -34,7 +34,13 @@
 #include "engine/iserverplugin.h"
 #include "eiface.h"
 #include "engine/IEngineTrace.h"
+#include "gametrace.h"
 #include "iserver.h"
+#include "edict.h"
+#include "utilities/conversions.h"
+#include "boost/unordered_set.hpp"
+#include <string>
+#include <vector>
 
 #include ENGINE_INCLUDE_PATH(engines.h)
 
@@ -45,6 +51,12 @@
 extern IServerPluginHelpers *helpers;
 
 
+//-----------------------------------------------------------------------------
+// Size of a PVS buffer (MAX_MAP_CLUSTERS bits).
+//-----------------------------------------------------------------------------
+#define PVS_BUFFER_SIZE 8192
+
+
 //-----------------------------------------------------------------------------
 // IVEngineServer extension class.
 //-----------------------------------------------------------------------------
@@ -97,6 +109,19 @@ public:
 		return pEngine->PrecacheDecal(szDecalName, bPreload);
 	}
 
+	static object GetPVSForOrigin(IVEngineServer* pEngine, const Vector& vecOrigin)
+	{
+		unsigned char pvs[PVS_BUFFER_SIZE];
+		int iCluster = pEngine->GetClusterForOrigin(vecOrigin);
+		int iLength = pEngine->GetPVSForCluster(iCluster, sizeof(pvs), pvs);
+
+		PyObject* pBytes = PyBytes_FromStringAndSize((const char *) pvs, iLength);
+		if (!pBytes)
+			throw_error_already_set();
+
+		return object(handle<>(pBytes));
+	}
+
 	static int precache_generic(IVEngineServer* pEngine, const char* szGenericName, bool bPreload = false)
 	{
 		if (*szGenericName == 0)
@@ -125,6 +150,93 @@ public:
 };
 
 
+//-----------------------------------------------------------------------------
+// Trace filter that is evaluated without calling into Python.
+//-----------------------------------------------------------------------------
+class CTraceFilterIgnore: public ITraceFilter
+{
+public:
+	CTraceFilterIgnore(object oIgnore, TraceType_t eTraceType, object oIncludeClassnames,
+		object oExcludeClassnames, object oIgnoreCollisionGroups, int iCollisionGroupOffset):
+		m_eTraceType(eTraceType),
+		m_iCollisionGroupOffset(iCollisionGroupOffset)
+	{
+		int iCount = len(oIgnore);
+		for (int i=0; i < iCount; ++i)
+			m_setIgnore.insert(ExcIntHandleFromIndex(extract<unsigned int>(oIgnore[i])));
+
+		iCount = len(oIncludeClassnames);
+		for (int i=0; i < iCount; ++i)
+			m_setIncludeClassnames.insert(extract<std::string>(oIncludeClassnames[i]));
+
+		iCount = len(oExcludeClassnames);
+		for (int i=0; i < iCount; ++i)
+			m_setExcludeClassnames.insert(extract<std::string>(oExcludeClassnames[i]));
+
+		iCount = len(oIgnoreCollisionGroups);
+		for (int i=0; i < iCount; ++i)
+			m_setIgnoreCollisionGroups.insert(extract<int>(oIgnoreCollisionGroups[i]));
+	}
+
+	virtual bool ShouldHitEntity(IHandleEntity* pEntity, int mask)
+	{
+		if (!pEntity)
+			return false;
+
+		const CBaseHandle& hBaseHandle = pEntity->GetRefEHandle();
+		if (m_setIgnore.find(hBaseHandle.ToInt()) != m_setIgnore.end())
+			return false;
+
+		// No other tests, no need to retrieve the edict
+		if (m_setIncludeClassnames.empty() && m_setExcludeClassnames.empty() &&
+			(m_setIgnoreCollisionGroups.empty() || m_iCollisionGroupOffset < 0))
+			return true;
+
+		// Entities without an edict (e.g. static props) can't be tested
+		edict_t* pEdict;
+		if (!EdictFromBaseHandle(hBaseHandle, pEdict))
+			return m_setIncludeClassnames.empty();
+
+		if (!m_setIncludeClassnames.empty() || !m_setExcludeClassnames.empty())
+		{
+			std::string szClassname = pEdict->GetClassName();
+			if (!m_setIncludeClassnames.empty() &&
+				m_setIncludeClassnames.find(szClassname) == m_setIncludeClassnames.end())
+				return false;
+
+			if (m_setExcludeClassnames.find(szClassname) != m_setExcludeClassnames.end())
+				return false;
+		}
+
+		if (!m_setIgnoreCollisionGroups.empty() && m_iCollisionGroupOffset >= 0)
+		{
+			CBaseEntity* pBaseEntity;
+			if (BaseEntityFromEdict(pEdict, pBaseEntity))
+			{
+				int iCollisionGroup = *(int *) ((unsigned long) pBaseEntity + m_iCollisionGroupOffset);
+				if (m_setIgnoreCollisionGroups.find(iCollisionGroup) != m_setIgnoreCollisionGroups.end())
+					return false;
+			}
+		}
+
+		return true;
+	}
+
+	virtual TraceType_t	GetTraceType() const
+	{
+		return m_eTraceType;
+	}
+
+private:
+	TraceType_t m_eTraceType;
+	int m_iCollisionGroupOffset;
+	boost::unordered_set<unsigned int> m_setIgnore;
+	boost::unordered_set<std::string> m_setIncludeClassnames;
+	boost::unordered_set<std::string> m_setExcludeClassnames;
+	boost::unordered_set<int> m_setIgnoreCollisionGroups;
+};
+
+
 //-----------------------------------------------------------------------------
 // IEntityEnumerator wrapper class.
 //-----------------------------------------------------------------------------
@@ -167,6 +279,138 @@ public:
 	{
 		pEngineTrace->EnumerateEntities(p1.Min(p2), p2.Max(p1), pEnumerator);
 	}
+
+	static dict TraceRays(IEngineTrace* pEngineTrace, object oRays, unsigned int iMask, ITraceFilter* pFilter)
+	{
+		std::vector<Vector> vecPositions;
+		GetRayPositions(oRays, vecPositions);
+
+		int iCount = vecPositions.size() / 2;
+		std::vector<float> vecFractions(iCount);
+		std::vector<float> vecEndPositions(iCount * 3);
+		std::vector<int> vecHitIndexes(iCount);
+		std::vector<int> vecHitGroups(iCount);
+		std::vector<unsigned short> vecSurfaceFlags(iCount);
+
+		Ray_t ray;
+		trace_t trace;
+		for (int i=0; i < iCount; ++i)
+		{
+			ray.Init(vecPositions[i * 2], vecPositions[i * 2 + 1]);
+			pEngineTrace->TraceRay(ray, iMask, pFilter, &trace);
+
+			vecFractions[i] = trace.fraction;
+			vecEndPositions[i * 3] = trace.endpos.x;
+			vecEndPositions[i * 3 + 1] = trace.endpos.y;
+			vecEndPositions[i * 3 + 2] = trace.endpos.z;
+			vecHitGroups[i] = trace.hitgroup;
+			vecSurfaceFlags[i] = trace.surface.flags;
+
+			// -1 means nothing (or a non-networked entity) was hit
+			unsigned int uiIndex;
+			if (trace.DidHit() && trace.m_pEnt && IndexFromBaseEntity(trace.m_pEnt, uiIndex))
+				vecHitIndexes[i] = uiIndex;
+			else
+				vecHitIndexes[i] = -1;
+		}
+
+		dict results;
+		results["fraction"] = GetColumn(vecFractions, "f", iCount, 1);
+		results["end_position"] = GetColumn(vecEndPositions, "f", iCount, 3);
+		results["hit_index"] = GetColumn(vecHitIndexes, "i", iCount, 1);
+		results["hitgroup"] = GetColumn(vecHitGroups, "i", iCount, 1);
+		results["surface_flags"] = GetColumn(vecSurfaceFlags, "H", iCount, 1);
+		return results;
+	}
+
+private:
+	static void GetRayPositions(object oRays, std::vector<Vector>& vecPositions)
+	{
+		// Was a buffer of (start x, y, z, end x, y, z) floats passed?
+		if (PyObject_CheckBuffer(oRays.ptr()))
+		{
+			Py_buffer buffer;
+			if (PyObject_GetBuffer(oRays.ptr(), &buffer, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) != 0)
+				throw_error_already_set();
+
+			if (buffer.itemsize != sizeof(float) || !IsNativeFloatFormat(buffer.format) ||
+				buffer.len % (6 * sizeof(float)) != 0)
+			{
+				PyBuffer_Release(&buffer);
+				BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Buffer must contain 6 floats per ray.");
+			}
+
+			const float* pFloats = (const float *) buffer.buf;
+			int iCount = buffer.len / (3 * sizeof(float));
+			vecPositions.reserve(iCount);
+			for (int i=0; i < iCount; ++i)
+				vecPositions.push_back(Vector(pFloats[i * 3], pFloats[i * 3 + 1], pFloats[i * 3 + 2]));
+
+			PyBuffer_Release(&buffer);
+			return;
+		}
+
+		// Otherwise, a sequence of (start, end) vectors is expected
+		int iCount = len(oRays);
+		vecPositions.reserve(iCount * 2);
+		for (int i=0; i < iCount; ++i)
+		{
+			object oRay = oRays[i];
+			vecPositions.push_back(extract<Vector&>(oRay[0]));
+			vecPositions.push_back(extract<Vector&>(oRay[1]));
+		}
+	}
+
+	static bool IsNativeFloatFormat(const char* szFormat)
+	{
+		// No format means unsigned bytes, but the item size was already checked
+		if (!szFormat)
+			return true;
+
+		// Is the byte order of the format the native byte order?
+		const unsigned short usByteOrder = 1;
+		bool bLittleEndian = *(const unsigned char *) &usByteOrder == 1;
+		switch (*szFormat)
+		{
+			case '@':
+			case '=':
+				++szFormat;
+				break;
+			case '<':
+				if (!bLittleEndian)
+					return false;
+
+				++szFormat;
+				break;
+			case '>':
+			case '!':
+				if (bLittleEndian)
+					return false;
+
+				++szFormat;
+				break;
+		}
+
+		return strcmp(szFormat, "f") == 0;
+	}
+
+	template<class T>
+	static object GetColumn(const std::vector<T>& vecValues, const char* szFormat, int iCount, int iValues)
+	{
+		PyObject* pBytes = PyBytes_FromStringAndSize(
+			vecValues.empty() ? NULL : (const char *) &vecValues[0], vecValues.size() * sizeof(T));
+
+		if (!pBytes)
+			throw_error_already_set();
+
+		object oColumn(handle<>(PyMemoryView_FromObject(object(handle<>(pBytes)).ptr())));
+
+		// Multi-dimensional casts don't support empty shapes
+		if (iValues == 1 || iCount == 0)
+			return oColumn.attr("cast")(szFormat);
+
+		return oColumn.attr("cast")(szFormat, make_tuple(iCount, iValues));
+	}
 };
 
 
@@ -164,6 +164,13 @@ void export_engine_server(scope _server)
 			args("cluster", "outputpvslength", "outputpvs")
 		)
 
+		.def("get_pvs_for_origin",
+			&IVEngineServerExt::GetPVSForOrigin,
+			"Returns the PVS bits of the cluster at the given position as bytes. "
+			"Bit (cluster % 8) of byte (cluster // 8) is set if the cluster is visible.",
+			args("origin")
+		)
+
 		.def("check_origin_in_pvs",
 			&IVEngineServer::CheckOriginInPVS,
 			"Check whether the specified origin is inside the PVS",
@@ -138,6 +138,16 @@ void export_engine_trace(scope _trace)
 			args("ray", "mask", "filter", "trace")
 		)
 
+		.def("trace_rays",
+			&IEngineTraceExt::TraceRays,
+			"Traces all given rays in one native loop.\n\n"
+			":param rays: A sequence of (start, end) Vector pairs or a buffer of 6 floats per ray.\n"
+			":return: A dictionary of memoryview objects with the keys 'fraction', 'end_position', "
+			"'hit_index', 'hitgroup' and 'surface_flags'. The hit index is -1 if nothing was hit.\n"
+			":rtype: dict",
+			args("rays", "mask", "filter")
+		)
+
 		.def("enumerate_entities",
 			GET_METHOD(void, IEngineTrace, EnumerateEntities, const Ray_t&, bool, IEntityEnumerator*),
 			"Enumerates over all entities along a ray.",
@@ -358,6 +368,17 @@ void export_trace_filter(scope _trace)
 
 		ADD_MEM_TOOLS_WRAPPER(ITraceFilterWrap, ITraceFilter)
 	;
+
+	class_<CTraceFilterIgnore, bases<ITraceFilter>, boost::noncopyable>(
+		"_TraceFilterIgnore",
+		init<object, TraceType_t, object, object, object, int>(
+			(arg("ignore"), arg("trace_type"), arg("include_classnames"), arg("exclude_classnames"),
+				arg("ignore_collision_groups"), arg("collision_group_offset")=-1),
+			"Initialize the filter. All tests are evaluated without calling into Python."
+		)
+	)
+		ADD_MEM_TOOLS(CTraceFilterIgnore)
+	;
 }
 
 
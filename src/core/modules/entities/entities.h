@@ -42,6 +42,33 @@
 #include "utilities/conversions.h"
 
 
+//-----------------------------------------------------------------------------
+// External variables.
+//-----------------------------------------------------------------------------
+extern CSharedEdictChangeInfo* g_pSharedChangeInfo;
+
+
+//-----------------------------------------------------------------------------
+// CBaseEdict extension class.
+//-----------------------------------------------------------------------------
+class BaseEdictExt
+{
+public:
+	static void StateChanged(CBaseEdict* pEdict, unsigned short usOffset)
+	{
+		// Without the shared change info, only the whole edict can be marked
+		if (!g_pSharedChangeInfo)
+		{
+			pEdict->StateChanged();
+			return;
+		}
+
+		// Only marks the given field, unless the whole edict is already marked
+		pEdict->StateChanged(usOffset);
+	}
+};
+
+
 //-----------------------------------------------------------------------------
 // CTakeDamageInfo wrapper class.
 //-----------------------------------------------------------------------------
@@ -39,6 +39,15 @@
 #include "utilities/conversions.h"
 #include "tier0/basetypes.h"
 #include "utilities/baseentity.h"
+#include "boost/unordered_map.hpp"
+#include <string>
+
+
+//-----------------------------------------------------------------------------
+// Typedefs.
+//-----------------------------------------------------------------------------
+typedef boost::unordered_map<std::string, typedescription_t *> DataMapFieldIndex;
+typedef boost::unordered_map<datamap_t *, DataMapFieldIndex> DataMapFieldIndexCache;
 
 
 //-----------------------------------------------------------------------------
@@ -57,29 +66,55 @@ public:
 	}
 
 	static typedescription_t *find(datamap_t *pDataMap, const char *szName)
+	{
+		if (!pDataMap)
+			return NULL;
+
+		DataMapFieldIndex& fieldIndex = GetFieldIndex(pDataMap);
+		DataMapFieldIndex::iterator it = fieldIndex.find(szName);
+		if (it == fieldIndex.end())
+			return NULL;
+
+		return it->second;
+	}
+
+	// Returns the lookup table of the given datamap. The table is built on
+	// first use and cached as long as the datamap exists, which is as long as
+	// the server binary is loaded.
+	static DataMapFieldIndex& GetFieldIndex(datamap_t *pDataMap)
+	{
+		static DataMapFieldIndexCache s_mapFieldIndexes;
+
+		DataMapFieldIndexCache::iterator it = s_mapFieldIndexes.find(pDataMap);
+		if (it != s_mapFieldIndexes.end())
+			return it->second;
+
+		DataMapFieldIndex& fieldIndex = s_mapFieldIndexes[pDataMap];
+		AddFieldsToIndex(pDataMap, fieldIndex);
+		return fieldIndex;
+	}
+
+private:
+	// Adds all fields in the same order a linear search would visit them.
+	// Existing names are never overwritten, so the first match wins.
+	static void AddFieldsToIndex(datamap_t *pDataMap, DataMapFieldIndex& fieldIndex)
 	{
 		while (pDataMap)
 		{
 			for (int iCurrentIndex=0; iCurrentIndex < pDataMap->dataNumFields; iCurrentIndex++)
 			{
-				typedescription_t pCurrentDataDesc = pDataMap->dataDesc[iCurrentIndex];
-				if ((pCurrentDataDesc.fieldName && strcmp(szName, pCurrentDataDesc.fieldName) == 0) ||
-					(pCurrentDataDesc.externalName && strcmp(szName, pCurrentDataDesc.externalName) == 0))
-				{
-					return &(pDataMap->dataDesc[iCurrentIndex]);
-				}
-				else if (pCurrentDataDesc.fieldType == FIELD_EMBEDDED)
-				{
-					typedescription_t *pReturnValue = find(pCurrentDataDesc.td, szName);
-					if (pReturnValue)
-					{
-						return pReturnValue;
-					}
-				}
+				typedescription_t& pCurrentDataDesc = pDataMap->dataDesc[iCurrentIndex];
+				if (pCurrentDataDesc.fieldName)
+					fieldIndex.insert(std::make_pair(std::string(pCurrentDataDesc.fieldName), &pCurrentDataDesc));
+
+				if (pCurrentDataDesc.externalName)
+					fieldIndex.insert(std::make_pair(std::string(pCurrentDataDesc.externalName), &pCurrentDataDesc));
+
+				if (pCurrentDataDesc.fieldType == FIELD_EMBEDDED)
+					AddFieldsToIndex(pCurrentDataDesc.td, fieldIndex);
 			}
 			pDataMap = pDataMap->baseMap;
 		}
-		return NULL;
 	}
 };
 
@@ -34,9 +34,19 @@
 #include "modules/memory/memory_tools.h"
 #include "utilities/conversions.h"
 #include "entities_entity.h"
+#include "entities.h"
+#include "boost/unordered_map.hpp"
+#include <vector>
 
 #include ENGINE_INCLUDE_PATH(entities_datamaps_wrap.h)
 
+
+//-----------------------------------------------------------------------------
+// Typedefs.
+//-----------------------------------------------------------------------------
+typedef boost::unordered_map<int, const char *> DataMapOutputIndex;
+typedef boost::unordered_map<datamap_t *, DataMapOutputIndex> DataMapOutputIndexCache;
+
 //-----------------------------------------------------------------------------
 // External variables.
 //-----------------------------------------------------------------------------
@@ -67,25 +77,149 @@ void spawn_entity(unsigned int uiEntityIndex)
 }
 
 
+//-----------------------------------------------------------------------------
+// Returns the entities of the given indexes...
+//-----------------------------------------------------------------------------
+inline void GetEntitiesFromIndexes(object oIndexes, std::vector<CBaseEntity *>& vecEntities)
+{
+	int iCount = len(oIndexes);
+	vecEntities.reserve(iCount);
+	for (int iCurrentIndex=0; iCurrentIndex < iCount; ++iCurrentIndex)
+		vecEntities.push_back(ExcBaseEntityFromIndex(extract<unsigned int>(oIndexes[iCurrentIndex])));
+}
+
+
+//-----------------------------------------------------------------------------
+// Copies a field of all given entities into one contiguous buffer...
+//-----------------------------------------------------------------------------
+object get_field_buffer(object oIndexes, int iOffset, int iSize)
+{
+	if (iOffset < 0 || iSize <= 0)
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Invalid offset (%i) or size (%i).", iOffset, iSize);
+
+	std::vector<CBaseEntity *> vecEntities;
+	GetEntitiesFromIndexes(oIndexes, vecEntities);
+
+	PyObject* pBytes = PyBytes_FromStringAndSize(NULL, vecEntities.size() * iSize);
+	if (!pBytes)
+		throw_error_already_set();
+
+	char* pBuffer = PyBytes_AS_STRING(pBytes);
+	for (unsigned int i=0; i < vecEntities.size(); ++i)
+		memcpy(pBuffer + i * iSize, (char *) vecEntities[i] + iOffset, iSize);
+
+	return object(handle<>(pBytes));
+}
+
+
+//-----------------------------------------------------------------------------
+// Copies one contiguous buffer into a field of all given entities...
+//-----------------------------------------------------------------------------
+void set_field_buffer(object oIndexes, int iOffset, int iSize, object oBuffer, bool bNetworked)
+{
+	if (iOffset < 0 || iSize <= 0)
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Invalid offset (%i) or size (%i).", iOffset, iSize);
+
+	std::vector<CBaseEntity *> vecEntities;
+	GetEntitiesFromIndexes(oIndexes, vecEntities);
+
+	Py_buffer buffer;
+	if (PyObject_GetBuffer(oBuffer.ptr(), &buffer, PyBUF_SIMPLE) != 0)
+		throw_error_already_set();
+
+	if (buffer.len != (Py_ssize_t) (vecEntities.size() * iSize))
+	{
+		Py_ssize_t iLength = buffer.len;
+		PyBuffer_Release(&buffer);
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Buffer size (%i) does not match %i entities of %i bytes.",
+			(int) iLength, (int) vecEntities.size(), iSize);
+	}
+
+	const char* pBuffer = (const char *) buffer.buf;
+	for (unsigned int i=0; i < vecEntities.size(); ++i)
+	{
+		memcpy((char *) vecEntities[i] + iOffset, pBuffer + i * iSize, iSize);
+
+		if (!bNetworked)
+			continue;
+
+		edict_t* pEdict;
+		if (EdictFromBaseEntity(vecEntities[i], pEdict))
+			BaseEdictExt::StateChanged(pEdict, (unsigned short) iOffset);
+	}
+
+	PyBuffer_Release(&buffer);
+}
+
+
+//-----------------------------------------------------------------------------
+// Returns (<index>, <classname>) tuples for all valid handles of an array...
+//-----------------------------------------------------------------------------
+list get_handle_array(unsigned int uiEntityIndex, int iOffset, int iCount)
+{
+	if (iOffset < 0 || iCount < 0)
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Invalid offset (%i) or count (%i).", iOffset, iCount);
+
+	CBaseHandle* pHandles = (CBaseHandle *) ((unsigned long) ExcBaseEntityFromIndex(uiEntityIndex) + iOffset);
+
+	list result;
+	for (int i=0; i < iCount; ++i)
+	{
+		unsigned int uiIndex;
+		if (!IndexFromBaseHandle(pHandles[i], uiIndex))
+			continue;
+
+		edict_t* pEdict;
+		if (!EdictFromIndex(uiIndex, pEdict))
+			continue;
+
+		result.append(make_tuple(uiIndex, str(pEdict->GetClassName())));
+	}
+
+	return result;
+}
+
+
 //-----------------------------------------------------------------------------
 // Find an entity output name
 //-----------------------------------------------------------------------------
-inline const char* FindOutputName(CBaseEntity* pCaller, void* pOutput)
+inline DataMapOutputIndex& GetOutputIndex(datamap_t* pDatamap)
 {
-	datamap_t* pDatamap = ((CBaseEntityWrapper *) pCaller)->GetDataDescMap();
+	static DataMapOutputIndexCache s_mapOutputIndexes;
+
+	DataMapOutputIndexCache::iterator it = s_mapOutputIndexes.find(pDatamap);
+	if (it != s_mapOutputIndexes.end())
+		return it->second;
+
+	// Map the offsets of all fields to their names. Existing offsets are never
+	// overwritten, so the first field of the linear search wins.
+	DataMapOutputIndex& outputIndex = s_mapOutputIndexes[pDatamap];
 	while (pDatamap)
 	{
 		for (int iCurrentIndex=0; iCurrentIndex < pDatamap->dataNumFields; ++iCurrentIndex)
 		{
-			typedescription_t pCurrentDataDesc = pDatamap->dataDesc[iCurrentIndex];
-			if ((unsigned long) pCaller + TypeDescriptionExt::get_offset(pCurrentDataDesc) == (unsigned long) pOutput)
-				return pCurrentDataDesc.externalName;
+			typedescription_t& pCurrentDataDesc = pDatamap->dataDesc[iCurrentIndex];
+			outputIndex.insert(std::make_pair(TypeDescriptionExt::get_offset(pCurrentDataDesc), pCurrentDataDesc.externalName));
 		}
 
 		pDatamap = pDatamap->baseMap;
 	}
 
-	return NULL;
+	return outputIndex;
+}
+
+inline const char* FindOutputName(CBaseEntity* pCaller, void* pOutput)
+{
+	datamap_t* pDatamap = ((CBaseEntityWrapper *) pCaller)->GetDataDescMap();
+	if (!pDatamap)
+		return NULL;
+
+	DataMapOutputIndex& outputIndex = GetOutputIndex(pDatamap);
+	DataMapOutputIndex::iterator it = outputIndex.find((int) ((unsigned long) pOutput - (unsigned long) pCaller));
+	if (it == outputIndex.end())
+		return NULL;
+
+	return it->second;
 }
 
 
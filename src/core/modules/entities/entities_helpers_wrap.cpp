@@ -76,6 +76,24 @@ void export_entity_helper_functions(scope _helpers)
 		args("entity_index")
 	);
 
+	def("get_field_buffer",
+		&get_field_buffer,
+		"Return the field at the given offset of all given entities as one contiguous bytes object.",
+		args("indexes", "offset", "size")
+	);
+
+	def("set_field_buffer",
+		&set_field_buffer,
+		"Copy the given buffer to the field at the given offset of all given entities.",
+		args("indexes", "offset", "size", "buffer", "networked")
+	);
+
+	def("get_handle_array",
+		&get_handle_array,
+		"Return (<index>, <classname>) tuples for all valid handles of the handle array at the given offset of the entity.",
+		args("index", "offset", "count")
+	);
+
 	def("find_output_name",
 		&FindOutputName,
 		args("caller", "output"),
@@ -339,12 +339,11 @@ void export_edict(scope _entities)
 			GET_METHOD(void, CBaseEdict, StateChanged)
 		)
 
-		/*
 		.def("state_changed",
-			static_cast< void(CBaseEdict::*)(unsigned short) >(&CBaseEdict::StateChanged),
+			&BaseEdictExt::StateChanged,
+			"Mark only the field at the given offset as changed.",
 			args("offset")
 		)
-		*/
 
 		.def("clear_transmit_state",
 			&CBaseEdict::ClearTransmitState
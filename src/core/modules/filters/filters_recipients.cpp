@@ -141,3 +141,41 @@ bool MRecipientFilter::HasRecipient( int iPlayer )
 {
 	return m_Recipients.HasElement(iPlayer);
 }
+
+unsigned long long MRecipientFilter::GetBits()
+{
+	unsigned long long ullBits = 0;
+	for(int i = 0; i < m_Recipients.Count(); i++)
+	{
+		int iPlayer = m_Recipients[i];
+		if (iPlayer > WORLD_ENTITY_INDEX && iPlayer <= RECIPIENT_BITS)
+			ullBits |= 1ULL << (iPlayer - 1);
+	}
+	return ullBits;
+}
+
+void MRecipientFilter::SetBits(unsigned long long ullBits)
+{
+	m_Recipients.RemoveAll();
+	AddBits(ullBits);
+}
+
+void MRecipientFilter::AddBits(unsigned long long ullBits)
+{
+	// Bit 0 represents the player at index 1
+	for(int iPlayer = 1; ullBits && iPlayer <= RECIPIENT_BITS; iPlayer++, ullBits >>= 1)
+	{
+		if (ullBits & 1)
+			AddRecipient(iPlayer);
+	}
+}
+
+void MRecipientFilter::RemoveBits(unsigned long long ullBits)
+{
+	for(int i = m_Recipients.Count() - 1; i >= 0; i--)
+	{
+		int iPlayer = m_Recipients[i];
+		if (iPlayer > WORLD_ENTITY_INDEX && iPlayer <= RECIPIENT_BITS && (ullBits & (1ULL << (iPlayer - 1))))
+			m_Recipients.Remove(i);
+	}
+}
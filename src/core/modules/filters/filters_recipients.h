@@ -38,6 +38,12 @@
 #include "tier1/utlvector.h"
 
 
+//---------------------------------------------------------------------------------
+// Number of players that can be represented by a recipient bit mask.
+//---------------------------------------------------------------------------------
+#define RECIPIENT_BITS 64
+
+
 //---------------------------------------------------------------------------------
 // Recipient filter class.
 //---------------------------------------------------------------------------------
@@ -58,6 +64,11 @@ public:
 	void RemoveAllPlayers();
 	bool HasRecipient(int iPlayer);
 
+	unsigned long long GetBits();
+	void SetBits(unsigned long long ullBits);
+	void AddBits(unsigned long long ullBits);
+	void RemoveBits(unsigned long long ullBits);
+
 private:
 	bool				m_bReliable;
 	bool				m_bInitMessage;
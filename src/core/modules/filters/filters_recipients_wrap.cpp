@@ -109,7 +109,29 @@ void export_mrecipientfilter(scope _recipients)
 			"Return True if the given index is in the recipient filter.",
 			args("index")
 		)
-			
+
+		.def("get_bits",
+			&MRecipientFilter::GetBits,
+			"Return the recipients as a bit mask. Bit 0 represents the player at index 1."
+		)
+
+		.def("set_bits",
+			&MRecipientFilter::SetBits,
+			"Replace the recipients with the players of the given bit mask.",
+			args("bits")
+		)
+
+		.def("add_bits",
+			&MRecipientFilter::AddBits,
+			"Add the players of the given bit mask to the filter.",
+			args("bits")
+		)
+
+		.def("remove_bits",
+			&MRecipientFilter::RemoveBits,
+			"Remove the players of the given bit mask from the filter.",
+			args("bits")
+		)
 
 		ADD_MEM_TOOLS(MRecipientFilter)
 	;
@@ -116,6 +116,47 @@ bool CUserMessage::IsProtobuf()
 #endif
 }
 
+tuple CUserMessage::GetPayload()
+{
+#ifdef USE_PROTOBUF
+	std::string data = m_buffer->SerializeAsString();
+	PyObject* pBytes = PyBytes_FromStringAndSize(data.data(), data.size());
+	int iNumBits = data.size() * 8;
+#else
+	PyObject* pBytes = PyBytes_FromStringAndSize(
+		(const char *) m_buffer->GetBasePointer(), m_buffer->GetNumBytesWritten());
+	int iNumBits = m_buffer->GetNumBitsWritten();
+#endif
+
+	if (!pBytes)
+		throw_error_already_set();
+
+	return make_tuple(object(handle<>(pBytes)), iNumBits);
+}
+
+void CUserMessage::SetPayload(object oData, int iNumBits)
+{
+	Py_buffer buffer;
+	if (PyObject_GetBuffer(oData.ptr(), &buffer, PyBUF_SIMPLE) != 0)
+		throw_error_already_set();
+
+	if (iNumBits < 0 || iNumBits > buffer.len * 8)
+	{
+		PyBuffer_Release(&buffer);
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Invalid number of bits: %i.", iNumBits);
+	}
+
+#ifdef USE_PROTOBUF
+	bool bParsed = m_buffer->ParseFromArray(buffer.buf, buffer.len);
+	PyBuffer_Release(&buffer);
+	if (!bParsed)
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Failed to parse the payload of '%s'.", m_message_name);
+#else
+	m_buffer->WriteBits(buffer.buf, iNumBits);
+	PyBuffer_Release(&buffer);
+#endif
+}
+
 //-----------------------------------------------------------------------------
 // Functions.
 //-----------------------------------------------------------------------------
@@ -331,6 +331,9 @@ public:
 	int GetMessageIndex();
 	static bool IsProtobuf();
 
+	tuple GetPayload();
+	void SetPayload(object oData, int iNumBits);
+
 private:
 	IRecipientFilter& m_recipients;
 	const char* m_message_name;
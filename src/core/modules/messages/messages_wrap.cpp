@@ -92,6 +92,17 @@ void export_user_message(scope _message)
 		&CUserMessage::IsProtobuf
 	).staticmethod("is_protobuf");
 
+	UserMessage.def("get_payload",
+		&CUserMessage::GetPayload,
+		"Return a tuple of the serialized buffer and its number of bits."
+	);
+
+	UserMessage.def("set_payload",
+		&CUserMessage::SetPayload,
+		"Write a payload returned by get_payload() into the buffer.",
+		args("data", "num_bits")
+	);
+
 	UserMessage ADD_MEM_TOOLS(CUserMessage);
 }
 
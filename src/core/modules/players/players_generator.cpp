@@ -32,6 +32,7 @@
 #include "edict.h"
 #include "boost/python/iterator.hpp"
 #include "utilities/conversions.h"
+#include "public/game/server/iplayerinfo.h"
 
 
 //-----------------------------------------------------------------------------
@@ -39,7 +40,28 @@
 //-----------------------------------------------------------------------------
 CPlayerGenerator::CPlayerGenerator( PyObject* self ):
 	IPythonGenerator<edict_t>(self),
-	m_iEntityIndex(0)
+	m_iEntityIndex(0),
+	m_uiIsFlags(0),
+	m_uiNotFlags(0),
+	m_uiIsTeams(0),
+	m_uiNotTeams(0),
+	m_iDeadFlagOffset(-1)
+{
+}
+
+
+//-----------------------------------------------------------------------------
+// CPlayerGenerator Constructor with filters.
+//-----------------------------------------------------------------------------
+CPlayerGenerator::CPlayerGenerator( PyObject* self, unsigned int uiIsFlags, unsigned int uiNotFlags,
+	unsigned int uiIsTeams, unsigned int uiNotTeams, int iDeadFlagOffset ):
+	IPythonGenerator<edict_t>(self),
+	m_iEntityIndex(0),
+	m_uiIsFlags(uiIsFlags),
+	m_uiNotFlags(uiNotFlags),
+	m_uiIsTeams(uiIsTeams),
+	m_uiNotTeams(uiNotTeams),
+	m_iDeadFlagOffset(iDeadFlagOffset)
 {
 }
 
@@ -49,7 +71,12 @@ CPlayerGenerator::CPlayerGenerator( PyObject* self ):
 //-----------------------------------------------------------------------------
 CPlayerGenerator::CPlayerGenerator( PyObject* self, const CPlayerGenerator& rhs ):
 	IPythonGenerator<edict_t>(self),
-	m_iEntityIndex(rhs.m_iEntityIndex)
+	m_iEntityIndex(rhs.m_iEntityIndex),
+	m_uiIsFlags(rhs.m_uiIsFlags),
+	m_uiNotFlags(rhs.m_uiNotFlags),
+	m_uiIsTeams(rhs.m_uiIsTeams),
+	m_uiNotTeams(rhs.m_uiNotTeams),
+	m_iDeadFlagOffset(rhs.m_iDeadFlagOffset)
 {
 }
 
@@ -71,8 +98,85 @@ edict_t *CPlayerGenerator::getNext()
 	while(m_iEntityIndex < gpGlobals->maxClients)
 	{
 		m_iEntityIndex++;
-		if (EdictFromIndex(m_iEntityIndex, pEdict))
-			break;
+		if (EdictFromIndex(m_iEntityIndex, pEdict) && IsValid(pEdict))
+			return pEdict;
+	}
+	return NULL;
+}
+
+
+//-----------------------------------------------------------------------------
+// Returns whether the player passes all filters.
+//-----------------------------------------------------------------------------
+bool CPlayerGenerator::IsValid(edict_t* pEdict)
+{
+	// No filters, no need to retrieve the player info
+	if (!m_uiIsFlags && !m_uiNotFlags && !m_uiIsTeams && !m_uiNotTeams)
+		return true;
+
+	if (m_uiIsFlags && !HasFlags(pEdict, m_uiIsFlags, true))
+		return false;
+
+	if (m_uiNotFlags && HasFlags(pEdict, m_uiNotFlags, false))
+		return false;
+
+	if (m_uiIsTeams || m_uiNotTeams)
+	{
+		IPlayerInfo* pPlayerInfo;
+		if (!PlayerInfoFromEdict(pEdict, pPlayerInfo))
+			return false;
+
+		int iTeam = pPlayerInfo->GetTeamIndex();
+		unsigned int uiTeam = (iTeam >= 0 && iTeam < 32) ? (1 << iTeam) : 0;
+
+		// All "is" teams need to match, so only a single team can pass
+		if (m_uiIsTeams && m_uiIsTeams != uiTeam)
+			return false;
+
+		if (m_uiNotTeams & uiTeam)
+			return false;
 	}
-	return pEdict;
+
+	return true;
+}
+
+
+//-----------------------------------------------------------------------------
+// Returns whether the player has all (or any) of the given flags.
+//-----------------------------------------------------------------------------
+bool CPlayerGenerator::HasFlags(edict_t* pEdict, unsigned int uiFlags, bool bAll)
+{
+	IPlayerInfo* pPlayerInfo;
+	if (!PlayerInfoFromEdict(pEdict, pPlayerInfo))
+		return false;
+
+	unsigned int uiPlayerFlags = 0;
+	if (uiFlags & (PLAYER_FILTER_BOT | PLAYER_FILTER_HUMAN))
+	{
+		uiPlayerFlags |= pPlayerInfo->IsFakeClient() ? PLAYER_FILTER_BOT : PLAYER_FILTER_HUMAN;
+	}
+
+	if (uiFlags & (PLAYER_FILTER_ALIVE | PLAYER_FILTER_DEAD))
+	{
+		bool bDead;
+		if (m_iDeadFlagOffset >= 0)
+		{
+			CBaseEntity* pEntity;
+			if (!BaseEntityFromEdict(pEdict, pEntity))
+				return false;
+
+			bDead = *(bool *) ((unsigned long) pEntity + m_iDeadFlagOffset);
+		}
+		else
+		{
+			bDead = pPlayerInfo->IsDead();
+		}
+
+		uiPlayerFlags |= bDead ? PLAYER_FILTER_DEAD : PLAYER_FILTER_ALIVE;
+	}
+
+	if (bAll)
+		return (uiPlayerFlags & uiFlags) == uiFlags;
+
+	return (uiPlayerFlags & uiFlags) != 0;
 }
@@ -35,6 +35,18 @@
 #include "edict.h"
 
 
+//-----------------------------------------------------------------------------
+// Player filter flags.
+//-----------------------------------------------------------------------------
+enum PlayerFilterFlags_t
+{
+	PLAYER_FILTER_BOT	= (1 << 0),
+	PLAYER_FILTER_HUMAN	= (1 << 1),
+	PLAYER_FILTER_ALIVE	= (1 << 2),
+	PLAYER_FILTER_DEAD	= (1 << 3)
+};
+
+
 //-----------------------------------------------------------------------------
 // Declare the generator class.
 //-----------------------------------------------------------------------------
@@ -42,14 +54,25 @@ class CPlayerGenerator: public IPythonGenerator<edict_t>
 {
 public:
 	CPlayerGenerator(PyObject* self);
+	CPlayerGenerator(PyObject* self, unsigned int uiIsFlags, unsigned int uiNotFlags,
+		unsigned int uiIsTeams, unsigned int uiNotTeams, int iDeadFlagOffset);
 	CPlayerGenerator(PyObject* self, const CPlayerGenerator& rhs);
 	virtual ~CPlayerGenerator();
 
 protected:
 	virtual edict_t* getNext();
 
+private:
+	bool IsValid(edict_t* pEdict);
+	bool HasFlags(edict_t* pEdict, unsigned int uiFlags, bool bAll);
+
 private:
 	int m_iEntityIndex;
+	unsigned int m_uiIsFlags;
+	unsigned int m_uiNotFlags;
+	unsigned int m_uiIsTeams;
+	unsigned int m_uiNotTeams;
+	int m_iDeadFlagOffset;
 };
 
 BOOST_SPECIALIZE_HAS_BACK_REFERENCE(CPlayerGenerator)
@@ -195,6 +195,10 @@ void export_playerinfo(scope _players)
 void export_player_generator(scope _players)
 {
 	class_<CPlayerGenerator>("PlayerGenerator")
+		.def(init<unsigned int, unsigned int, unsigned int, unsigned int, int>(
+			(arg("is_flags"), arg("not_flags"), arg("is_teams"), arg("not_teams"), arg("dead_flag_offset")=-1),
+			"Only yield players passing the given filter flags and team masks."))
+
 		.def("__iter__",
 			&CPlayerGenerator::iter,
 			"Returns the iterable object."
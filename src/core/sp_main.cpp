@@ -95,6 +95,7 @@ IMDLCache*				modelcache			= NULL;
 IVoiceServer*			voiceserver			= NULL;
 INetworkStringTableContainer* networkstringtable = NULL;
 IEngineTool*			enginetool			= NULL;
+CSharedEdictChangeInfo*	g_pSharedChangeInfo	= NULL; // required by CBaseEdict::StateChanged(unsigned short)
 
 //-----------------------------------------------------------------------------
 // External globals
@@ -233,6 +234,9 @@ bool CSourcePython::Load(	CreateInterfaceFn interfaceFactory, CreateInterfaceFn
 		return false;
 	}
 	
+	DevMsg(1, MSG_PREFIX "Retrieving shared edict change info...\n");
+	g_pSharedChangeInfo = engine->GetSharedEdictChangeInfo();
+
 	DevMsg(1, MSG_PREFIX "Initializing mathlib...\n");
 	MathLib_Init( 2.2f, 2.2f, 0.0f, 2.0f );
 